@@ -4,7 +4,7 @@ axcrypt/core/config.py
 Central configuration & constants for AxCrypt.
 """
 
-import os
+import os, sys, types
 
 # ─── App Identity ─────────────────────────────────────────────────────────────
 APP_NAME        = "AxCrypt"
@@ -26,8 +26,21 @@ _SCRIPT_DIR     = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR      = os.path.join(_SCRIPT_DIR, "assets")
 LOGO_PATH       = os.path.join(ASSETS_DIR, "logo.png")
 
-for _d in (APP_DIR, DATA_DIR, TEMP_DIR):
-    os.makedirs(_d, exist_ok=True)
+_dirs_ready = False
+
+
+def ensure_dirs() -> None:
+    """Create the app / data / temp directories (once per process).
+
+    Called from the app bootstrap and before the first on-disk DB touch,
+    so merely importing this module performs no filesystem work.
+    """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    for _d in (APP_DIR, DATA_DIR, TEMP_DIR):
+        os.makedirs(_d, exist_ok=True)
+    _dirs_ready = True
 
 # ─── Cryptographic Constants ─────────────────────────────────────────────────
 SALT_SIZE       = 16
@@ -81,7 +94,7 @@ FONTS = {
 }
 
 # ─── Cyberpunk Colour Palette ─────────────────────────────────────────────────
-C = dict(
+_C_RAW = dict(
     bg_deep      = "#0a0c0f",
     bg_panel     = "#111318",
     bg_card      = "#161a22",
@@ -109,6 +122,8 @@ C = dict(
     btn_hover    = "#1f2530",
     bg_hover     = "#1a1e28",
 )
+# Read-only view; colour strings interned so repeated values share one object
+C = types.MappingProxyType({k: sys.intern(v) for k, v in _C_RAW.items()})
 
 # ─── Encryption-Difficulty Thresholds ─────────────────────────────────────────
 DIFFICULTY_TIERS = [
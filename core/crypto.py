@@ -10,11 +10,7 @@ All cryptographic primitives for AxCrypt.
   • Steganographic owner-metadata embedding
 """
 
-import os, hmac, hashlib, logging, secrets, struct, json, time, tempfile
-from cryptography.hazmat.primitives.ciphers  import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
-from cryptography.hazmat.primitives.padding  import PKCS7
-from cryptography.hazmat.backends           import default_backend
+import os, hmac, hashlib, logging, secrets, struct, json, time, tempfile, functools
 
 from core.config import (
     SALT_SIZE, IV_SIZE, KEY_SIZE,
@@ -32,14 +28,34 @@ _HMAC_KEY = b"AxCrypt_TimeLock_2025_SecretKey!"
 # PASSWORD UTILITIES
 # ══════════════════════════════════════════════════════════════════════════════
 
-def derive_key(password: str, salt: bytes) -> bytes:
-    """Derive a 256-bit AES key via scrypt."""
+# NOTE: `cryptography` is imported lazily inside the functions that need it so
+# that UI-only paths (config / session / history screens) stay cheap to import.
+
+@functools.lru_cache(maxsize=16)
+def _derive_cached(password: str, salt: bytes) -> bytes:
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
     kdf = Scrypt(salt=salt, length=KEY_SIZE,
-                 n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P,
-                 backend=default_backend())
+                 n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
     return kdf.derive(password.encode("utf-8"))
 
 
+def derive_key(password: str, salt: bytes) -> bytes:
+    """Derive a 256-bit AES key via scrypt.
+
+    Results are memoised per (password, salt) for the session.  The cache
+    holds plaintext passwords, so it MUST be emptied via clear_key_cache()
+    on logout / lock.
+    """
+    return _derive_cached(password, salt)
+
+
+def clear_key_cache() -> None:
+    """Drop every cached password-derived value (call on logout / lock)."""
+    _derive_cached.cache_clear()
+    _password_strength_cached.cache_clear()
+    _verify_token.cache_clear()
+
+
 def hash_password(password: str, salt: bytes | None = None) -> bytes:
     """Return salt + derived-key blob for credential storage."""
     if salt is None:
@@ -58,6 +74,16 @@ def verify_password(password: str, blob: bytes) -> bool:
         return False
 
 
+# Per-byte category bitmask: 1=upper, 2=lower, 4=digit, 8=special
+_SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;:',.<>?/~`"
+_CAT_TABLE = bytearray(256)
+for _c in range(ord("A"), ord("Z") + 1): _CAT_TABLE[_c] = 1
+for _c in range(ord("a"), ord("z") + 1): _CAT_TABLE[_c] = 2
+for _c in range(ord("0"), ord("9") + 1): _CAT_TABLE[_c] = 4
+for _c in _SPECIAL_CHARS.encode("ascii"): _CAT_TABLE[_c] = 8
+del _c
+
+
 def password_strength(pwd: str) -> int:
     """Return 0-100 score.
 
@@ -65,16 +91,31 @@ def password_strength(pwd: str) -> int:
       length ≥8  → +20   length ≥12 → +15   length ≥16 → +10
       upper      → +15   lower      → +10   digit       → +10
       special    → +15   mix (≥3 categories) → +5
+
+    Only the first 100 characters are scored (zxcvbn-style cap) so a huge
+    paste cannot stall a per-keystroke strength meter.  Scores are memoised
+    per truncated input; the cache holds the scored strings and is emptied
+    by clear_key_cache().
     """
+    return _password_strength_cached(pwd[:100])
+
+
+@functools.lru_cache(maxsize=128)
+def _password_strength_cached(pwd: str) -> int:
     s = 0
     if len(pwd) >= 8:  s += 20
     if len(pwd) >= 12: s += 15
     if len(pwd) >= 16: s += 10
 
-    has_upper   = any(c.isupper()   for c in pwd)
-    has_lower   = any(c.islower()   for c in pwd)
-    has_digit   = any(c.isdigit()   for c in pwd)
-    has_special = any(c in "!@#$%^&*()_+-=[]{}|;:',.<>?/~`" for c in pwd)
+    # Single pass over the encoded bytes, OR-ing category bits together
+    mask, t = 0, _CAT_TABLE
+    for b in pwd.encode("utf-8", "ignore"):
+        mask |= t[b]
+
+    has_upper   = bool(mask & 1)
+    has_lower   = bool(mask & 2)
+    has_digit   = bool(mask & 4)
+    has_special = bool(mask & 8)
 
     cats = sum((has_upper, has_lower, has_digit, has_special))
     if has_upper:   s += 15
@@ -104,17 +145,25 @@ def strength_label(score: int):
 #   OTD-flag: 0x00 = normal, 0x01 = one-time-decrypt
 #   steg-len: big-endian uint16 – length of steganographic JSON payload
 
+_HLEN = struct.Struct(">H")           # steg-len field, compiled once
+
+def _cbc_cipher(key: bytes, iv: bytes):
+    """AES-256-CBC Cipher object (imports `cryptography` on first use)."""
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    return Cipher(algorithms.AES(key), modes.CBC(iv))
+
+
 def _build_header(otd: bool, steg_meta: bytes) -> bytes:
     """Assemble the post-IV header bytes."""
     flag  = b"\x01" if otd else b"\x00"
-    slen  = struct.pack(">H", len(steg_meta))
+    slen  = _HLEN.pack(len(steg_meta))
     return flag + slen + steg_meta
 
 
 def _parse_header(raw: bytes):
     """Parse header after salt+iv.  Returns (otd_flag, steg_bytes, payload_offset)."""
     otd_flag  = raw[0] == 0x01
-    slen      = struct.unpack(">H", raw[1:3])[0]
+    slen      = _HLEN.unpack_from(raw, 1)[0]
     steg_meta = raw[3:3 + slen]
     payload_offset = 3 + slen          # relative to end of salt+iv
     return otd_flag, steg_meta, payload_offset
@@ -149,8 +198,8 @@ def encrypt_file(
 
         header = _build_header(one_time_decrypt, steg_payload)
 
-        cipher   = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
+        from cryptography.hazmat.primitives.padding import PKCS7
+        encryptor = _cbc_cipher(key, iv).encryptor()
         padder    = PKCS7(128).padder()
 
         file_size = os.path.getsize(src_path) or 1
@@ -201,33 +250,29 @@ def encrypt_file_replace(
     - Violated OS file-handling rules on all platforms
     
     Correct strategy:
-    1. Read the entire original file content (then CLOSE it)
-    2. Encrypt the data in memory
-    3. Write encrypted data to a TEMPORARY file in the same directory
-    4. Flush and fsync the temp file to ensure data is on disk
+    1. Stream the original file through the cipher in 64 KiB chunks
+    2. Write framing + ciphertext to a TEMPORARY file in the same directory
+    3. Flush and fsync the temp file to ensure data is on disk
+    4. Close BOTH files before touching the original path
     5. Use os.replace(temp_file, original_file) to atomically swap
     6. Original path remains unchanged, only content is replaced
-    
+
     Benefits:
     - Crash-safe: If power fails, either old or new file exists (no corruption)
     - Atomic: Operation completes fully or not at all
+    - Bounded memory: RAM use is independent of file size
     - Cross-platform: Works on Windows, Linux, macOS
     - Reversible: Can decrypt using same path
-    
+
     Returns (success, original_path, error_message).
     """
     try:
         if not os.path.exists(src_path):
             return False, None, "Source file not found."
 
-        # STEP 1: Read original file content completely
-        with open(src_path, "rb") as fin:
-            plaintext = fin.read()
-        # File is now CLOSED - no file descriptor issues
-        
-        file_size = len(plaintext) or 1
+        file_size = os.stat(src_path).st_size or 1
 
-        # STEP 2: Generate encryption parameters
+        # STEP 1: Generate encryption parameters
         salt = secrets.token_bytes(SALT_SIZE)
         iv   = secrets.token_bytes(IV_SIZE)
         key  = derive_key(password, salt)
@@ -240,52 +285,44 @@ def encrypt_file_replace(
 
         header = _build_header(one_time_decrypt, steg_payload)
 
-        # STEP 3: Encrypt data in memory
-        cipher   = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
+        from cryptography.hazmat.primitives.padding import PKCS7
+        encryptor = _cbc_cipher(key, iv).encryptor()
         padder    = PKCS7(128).padder()
 
-        # Encrypt in chunks for progress reporting
-        encrypted_chunks = []
-        chunk_size = 8192
-        processed = 0
-        
-        for i in range(0, len(plaintext), chunk_size):
-            chunk = plaintext[i:i + chunk_size]
-            encrypted_chunks.append(encryptor.update(padder.update(chunk)))
-            processed += len(chunk)
-            if progress_cb:
-                progress_cb(min(processed / file_size, 0.95))
-        
-        # Finalize encryption
-        encrypted_chunks.append(encryptor.update(padder.finalize()) + encryptor.finalize())
-        ciphertext = b"".join(encrypted_chunks)
-
-        # STEP 4: Write to temporary file in SAME DIRECTORY
+        # STEP 2: Temporary file in SAME DIRECTORY
         # (same filesystem ensures atomic os.replace())
         src_dir = os.path.dirname(src_path) or "."
         fd, temp_path = tempfile.mkstemp(dir=src_dir, prefix=".axcrypt_tmp_", suffix=".enc")
-        
+
         try:
-            # Write encrypted data to temp file
-            with os.fdopen(fd, 'wb') as fout:
-                fout.write(salt + iv + header)
-                fout.write(ciphertext)
+            # STEP 3: Stream plaintext → ciphertext straight into the temp file
+            processed = 0
+            with os.fdopen(fd, "wb", buffering=1 << 20) as fout, \
+                 open(src_path, "rb", buffering=1 << 20) as fin:
+                fout.write(salt + iv + header)      # unencrypted framing
+
+                while chunk := fin.read(65536):
+                    processed += len(chunk)
+                    fout.write(encryptor.update(padder.update(chunk)))
+                    if progress_cb:
+                        progress_cb(min(processed / file_size, 0.95))
+
+                fout.write(encryptor.update(padder.finalize()) + encryptor.finalize())
                 fout.flush()
                 os.fsync(fout.fileno())
-            # Temp file is now CLOSED and synced to disk
-            
-            # STEP 5: Atomically replace original with encrypted content
+            # Both files are now CLOSED and the temp file is synced to disk
+
+            # STEP 4: Atomically replace original with encrypted content
             # This is atomic on POSIX and Windows (Python 3.3+)
             # The original file path is preserved, only content changes
             os.replace(temp_path, src_path)
-            
+
             if progress_cb:
                 progress_cb(1.0)
-            
+
             log.info("Encrypted and replaced %s (in-place)  otd=%s", src_path, one_time_decrypt)
             return True, src_path, None
-            
+
         except Exception as replace_err:
             # Clean up temp file on error
             try:
@@ -312,36 +349,64 @@ def decrypt_file(
     Returns (success, decrypted_path, error, was_otd).
     If the file was OTD-flagged *was_otd* is True – caller must handle
     re-encrypt / delete after the user is done.
+
+    Ciphertext is streamed in 64 KiB chunks into a temp file next to
+    *output_path*, which is only swapped in once padding has verified – so a
+    wrong password never leaves a half-written plaintext behind and
+    *output_path* may safely equal *enc_path*.
     """
     try:
         if not os.path.exists(enc_path):
             return False, None, "Encrypted file not found.", False
 
-        with open(enc_path, "rb") as f:
-            salt = f.read(SALT_SIZE)
-            iv   = f.read(IV_SIZE)
-            # Read enough bytes for the fixed + variable header
-            peek = f.read(3)                  # flag(1) + slen(2)
-            slen = struct.unpack(">H", peek[1:3])[0]
-            steg_meta = f.read(slen)          # may be empty
-            ciphertext = f.read()             # rest is ciphertext
-
-        otd_flag = peek[0] == 0x01
-
-        key = derive_key(password, salt)
-        cipher    = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        decryptor = cipher.decryptor()
-        unpadder  = PKCS7(128).unpadder()
-
-        plaintext = unpadder.update(decryptor.update(ciphertext)) + \
-                    unpadder.update(decryptor.finalize()) + unpadder.finalize()
-
         # Determine output path
         if output_path is None:
             output_path = enc_path[:-4] if enc_path.endswith(".enc") else enc_path + ".dec"
 
-        with open(output_path, "wb") as fout:
-            fout.write(plaintext)
+        temp_path = None
+        try:
+            with open(enc_path, "rb", buffering=1 << 20) as f:
+                salt = f.read(SALT_SIZE)
+                iv   = f.read(IV_SIZE)
+                # Read enough bytes for the fixed + variable header
+                peek = f.read(3)                  # flag(1) + slen(2)
+                slen = _HLEN.unpack_from(peek, 1)[0]
+                steg_meta = f.read(slen)          # may be empty
+
+                otd_flag = peek[0] == 0x01
+                total_ct = (os.fstat(f.fileno()).st_size - f.tell()) or 1
+
+                key = derive_key(password, salt)
+                from cryptography.hazmat.primitives.padding import PKCS7
+                decryptor = _cbc_cipher(key, iv).decryptor()
+                unpadder  = PKCS7(128).unpadder()
+
+                out_dir = os.path.dirname(output_path) or "."
+                fd, temp_path = tempfile.mkstemp(dir=out_dir, prefix=".axcrypt_tmp_", suffix=".dec")
+                processed = 0
+                with os.fdopen(fd, "wb", buffering=1 << 20) as fout:
+                    while chunk := f.read(65536):
+                        processed += len(chunk)
+                        fout.write(unpadder.update(decryptor.update(chunk)))
+                        if progress_cb:
+                            progress_cb(min(processed / total_ct, 0.95))
+                    # CBC finalize() yields no bytes; only the unpadder's
+                    # held-back last block remains to be written.
+                    tail = decryptor.finalize()
+                    if tail:
+                        fout.write(unpadder.update(tail))
+                    fout.write(unpadder.finalize())
+
+            # Source is closed – safe to replace even when output_path == enc_path
+            os.replace(temp_path, output_path)
+        except Exception:
+            # Never leave (possibly complete) plaintext behind in the temp file
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            raise
 
         if progress_cb:
             progress_cb(1.0)
@@ -360,7 +425,7 @@ def read_steg_metadata(enc_path: str) -> dict | None:
         with open(enc_path, "rb") as f:
             f.read(SALT_SIZE + IV_SIZE)
             peek = f.read(3)
-            slen = struct.unpack(">H", peek[1:3])[0]
+            slen = _HLEN.unpack_from(peek, 1)[0]
             raw  = f.read(slen)
         if raw[:2] == STEG_MAGIC:
             return json.loads(raw[2:].decode("utf-8"))
@@ -373,8 +438,17 @@ def read_steg_metadata(enc_path: str) -> dict | None:
 # SECURE DELETE
 # ══════════════════════════════════════════════════════════════════════════════
 
+_WIPE_BLOCK = 1 << 20
+_ZERO_BLOCK = memoryview(bytes(_WIPE_BLOCK))
+_ONES_BLOCK = memoryview(b"\xff" * _WIPE_BLOCK)
+
+
 def secure_delete(path: str, passes: int = WIPE_PASSES) -> bool:
-    """Multi-pass overwrite then unlink."""
+    """Multi-pass overwrite then unlink.
+
+    Each pass is streamed in 1 MiB blocks so RAM use does not grow with
+    the file size; the constant patterns are shared module-level buffers.
+    """
     try:
         if not os.path.exists(path):
             return True
@@ -384,15 +458,20 @@ def secure_delete(path: str, passes: int = WIPE_PASSES) -> bool:
             return True
 
         patterns = [
-            lambda _: b"\x00" * size,                   # all-zeros
-            lambda _: b"\xff" * size,                   # all-ones
-            lambda _: secrets.token_bytes(size),        # random
+            lambda n: _ZERO_BLOCK[:n],                  # all-zeros
+            lambda n: _ONES_BLOCK[:n],                  # all-ones
+            os.urandom,                                 # random
         ]
 
         with open(path, "r+b") as fh:
             for i in range(passes):
+                block_for = patterns[i % len(patterns)]
                 fh.seek(0)
-                fh.write(patterns[i % len(patterns)](i))
+                remaining = size
+                while remaining:
+                    n = min(remaining, _WIPE_BLOCK)
+                    fh.write(block_for(n))
+                    remaining -= n
                 fh.flush()
                 os.fsync(fh.fileno())
         os.remove(path)
@@ -407,14 +486,31 @@ def secure_delete(path: str, passes: int = WIPE_PASSES) -> bool:
         return False
 
 
+def _iter_files(dir_path: str):
+    """Yield every non-directory path under *dir_path* (symlinks not followed)."""
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            else:
+                yield entry.path
+
+
 def secure_delete_dir(dir_path: str) -> None:
-    """Recursively secure-delete every file in *dir_path*, then rmdir."""
+    """Recursively secure-delete every file in *dir_path*, then rmdir.
+
+    Wiping is fsync-bound, so files are overwritten concurrently on a small
+    thread pool (the GIL is released during write/fsync).
+    """
     import shutil
+    from concurrent.futures import ThreadPoolExecutor
     if not os.path.isdir(dir_path):
         return
-    for root, _dirs, files in os.walk(dir_path):
-        for fname in files:
-            secure_delete(os.path.join(root, fname))
+    paths = list(_iter_files(dir_path))
+    if paths:
+        workers = min(16, (os.cpu_count() or 1) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(secure_delete, paths))
     shutil.rmtree(dir_path, ignore_errors=True)
 
 
@@ -435,20 +531,38 @@ def generate_time_locked_password(base_password: str, duration_secs: int) -> tup
     b64_sig = base64.urlsafe_b64encode(sig).decode()
     return f"{b64_payload}.{b64_sig}", expiry
 
-def validate_time_locked_password(token: str) -> tuple[bool, str | None, str | None]:
-    """Validate token.  Returns (valid, base_password, error_msg)."""
+@functools.lru_cache(maxsize=8)
+def _verify_token(token: str) -> tuple[tuple | None, str | None]:
+    """Signature check + decode, memoised per token string.
+
+    Returns ((base_password, expiry), None) or (None, error_msg).  Expiry is
+    deliberately NOT checked here – that depends on the clock, not the token.
+    The cache holds base passwords, so clear_key_cache() empties it.
+    """
     try:
         parts = token.split(".")
         if len(parts) != 2:
-            return False, None, "Malformed token."
+            return None, "Malformed token."
         b64_payload, b64_sig = parts
         expected_sig = hmac.new(_HMAC_KEY, b64_payload.encode(), hashlib.sha256).digest()
         provided_sig = base64.urlsafe_b64decode(b64_sig)
         if not hmac.compare_digest(expected_sig, provided_sig):
-            return False, None, "Signature mismatch – token tampered."
+            return None, "Signature mismatch – token tampered."
         payload = json.loads(base64.urlsafe_b64decode(b64_payload).decode())
-        if time.time() > payload["e"]:
+        return (payload["p"], payload["e"]), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def validate_time_locked_password(token: str) -> tuple[bool, str | None, str | None]:
+    """Validate token.  Returns (valid, base_password, error_msg)."""
+    fields, err = _verify_token(token)
+    if fields is None:
+        return False, None, err
+    base_password, expiry = fields
+    try:
+        if time.time() > expiry:
             return False, None, "Token expired."
-        return True, payload["p"], None
     except Exception as exc:
-        return False, None, str(exc)
\ No newline at end of file
+        return False, None, str(exc)
+    return True, base_password, None
\ No newline at end of file
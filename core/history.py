@@ -3,7 +3,8 @@ axcrypt/core/history.py
 ───────────────────────
 Tamper-resistant encryption-activity log.
 
-Each entry is HMAC-chained: the HMAC of entry N includes the HMAC of entry N-1.
+Each entry is hash-chained: the keyed BLAKE2b of entry N includes the hash of
+entry N-1.
 Any modification / deletion / reorder of an entry breaks the chain and is
 detected on load.
 
@@ -13,57 +14,161 @@ mechanism as the users store).
 
 import os, json, time, hmac, hashlib, logging, secrets
 from datetime import datetime
-from core.config import HISTORY_DB
+from pathlib  import Path
+from core.config import HISTORY_DB, ensure_dirs
 
 log = logging.getLogger("axcrypt.history")
 
-# ─── Reuse the encrypted-blob helpers from user_manager ──────────────────────
-from core.user_manager import _encrypt_blob, _decrypt_blob
+# ─── Reuse the encrypted-blob + JSON helpers from user_manager ───────────────
+#     (chain hashing below always uses stdlib json for stable bytes)
+from core.user_manager import _encrypt_blob, _decrypt_blob, _dumps, _loads
 
-# HMAC key for the chain – derived at import time from a per-install secret
+# Key for the chain hash – derived at import time from a per-install secret
 _CHAIN_KEY_FILE = os.path.join(os.path.dirname(HISTORY_DB), "chain.key")
+_CHAIN_KEY_CACHE: bytes | None = None      # key never rotates within a process
 
 
 def _chain_key() -> bytes:
+    global _CHAIN_KEY_CACHE
+    if _CHAIN_KEY_CACHE is not None:
+        return _CHAIN_KEY_CACHE
     if os.path.exists(_CHAIN_KEY_FILE):
         with open(_CHAIN_KEY_FILE, "rb") as f:
-            return f.read()
+            _CHAIN_KEY_CACHE = f.read()
+        return _CHAIN_KEY_CACHE
     key = secrets.token_bytes(32)
     with open(_CHAIN_KEY_FILE, "wb") as f:
         f.write(key)
+    _CHAIN_KEY_CACHE = key
     return key
 
 
-def _entry_hash(entry: dict, prev_hash: str) -> str:
-    """Compute HMAC-SHA256 for an entry, chained to prev_hash."""
-    payload = json.dumps({"entry": entry, "prev": prev_hash}, sort_keys=True)
+# Chain-format marker: also the prev-hash of the first entry.  Bumped when the
+# hash construction changes; older chains are migrated on load (see _migrate).
+_GENESIS = "GENESIS_B4"
+_LEGACY_GENESIS = "GENESIS"     # original HMAC-SHA256 / sort_keys chain
+
+_HASH_TEMPLATE = None     # keyed blake2b; .copy() skips re-processing the key block
+
+
+def _hash_template():
+    global _HASH_TEMPLATE
+    if _HASH_TEMPLATE is None:
+        _HASH_TEMPLATE = hashlib.blake2b(key=_chain_key(), digest_size=32)
+    return _HASH_TEMPLATE
+
+
+# Keys every entry carries, in the order they are fed to the hash.  Anything
+# else (caller-supplied extras) is appended as a sorted dict; "_hash" is the
+# entry's own digest and never part of its input.
+_CANON_FIELDS = ("action", "filename", "algorithm", "status", "user", "timestamp")
+_CANON_SKIP   = frozenset(_CANON_FIELDS) | {"_hash"}
+
+
+def _canonical(entry: dict) -> bytes:
+    """Stable byte serialisation of an entry's content without sort_keys."""
+    fixed = [entry.get(k) for k in _CANON_FIELDS]
+    extra = {k: entry[k] for k in sorted(entry.keys() - _CANON_SKIP)}
+    return json.dumps([fixed, extra], separators=(",", ":")).encode()
+
+
+def _entry_hash(canon: bytes, prev_hash: str) -> str:
+    """Compute keyed BLAKE2b-256 over an entry's canonical bytes + prev_hash.
+
+    Each call works on an independent copy of the template, so the template
+    itself is never mutated and is safe to share across threads.
+    """
+    h = _hash_template().copy()
+    h.update(canon)
+    h.update(prev_hash.encode())
+    return h.hexdigest()
+
+
+def _legacy_entry_hash(entry: dict, prev_hash: str) -> str:
+    """Original chain construction: HMAC-SHA256 over sort_keys JSON."""
+    body    = {k: v for k, v in entry.items() if k != "_hash"}
+    payload = json.dumps({"entry": body, "prev": prev_hash}, sort_keys=True)
     return hmac.new(_chain_key(), payload.encode(), hashlib.sha256).hexdigest()
 
 
+def display_time(entry: dict) -> str:
+    """Human-readable time for an entry, formatted from its ISO timestamp."""
+    try:
+        return datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d  %H:%M:%S")
+    except (KeyError, TypeError, ValueError):
+        return entry.get("display_time", "?")     # pre-existing entries
+
+
 class HistoryManager:
-    """Load / save / append / verify the HMAC-chained history."""
+    """Load / save / append / verify the hash-chained history."""
 
     MAX_ENTRIES = 200
 
     def __init__(self):
         self.entries: list[dict] = []
+        self._canon:   list[bytes] = []        # canonical bytes, parallel to entries (not persisted)
+        self._window_anchor: str = _GENESIS    # prev-hash of the oldest kept entry
+        self._tip_hash:      str = _GENESIS    # hash of the newest entry
+        ensure_dirs()
         self._load()
 
     # ── persistence ────────────────────────────────────────────────────────
     def _load(self):
+        self._window_anchor = self._tip_hash = _GENESIS
+        self._canon = []
         if not os.path.exists(HISTORY_DB):
             self.entries = []
             return
         try:
-            raw  = open(HISTORY_DB, "rb").read()
-            data = json.loads(_decrypt_blob(raw).decode("utf-8"))
+            raw  = Path(HISTORY_DB).read_bytes()
+            data = _loads(_decrypt_blob(raw))
             self.entries = data.get("entries", [])
+            if data.get("chain") != _GENESIS:
+                self._migrate()
+                return
+            self._canon  = [_canonical(e) for e in self.entries]
+            self._window_anchor = data.get("anchor", _GENESIS)
+            self._tip_hash = self.entries[-1]["_hash"] if self.entries else self._window_anchor
         except Exception as exc:
             log.warning("History load failed (%s) – starting fresh.", exc)
             self.entries = []
+            self._canon  = []
+
+    def _migrate(self):
+        """Re-hash a chain written in the legacy format into the current one.
+
+        The legacy chain is verified first; only an intact chain is re-hashed
+        (anchored at the current genesis) and saved.  A chain that fails
+        verification is kept as-is, so verify_chain() reports it as tampered.
+        """
+        prev = _LEGACY_GENESIS
+        for i, entry in enumerate(self.entries):
+            if entry.get("_hash") != _legacy_entry_hash(entry, prev):
+                log.warning("Legacy history chain broken at entry #%d – "
+                            "kept unmigrated and flagged as tampered.", i)
+                self._canon = [_canonical(e) for e in self.entries]
+                self._window_anchor = _GENESIS
+                self._tip_hash = self.entries[-1].get("_hash", _GENESIS)
+                return
+            prev = entry["_hash"]
+
+        self._canon = []
+        self._window_anchor = prev = _GENESIS
+        for entry in self.entries:
+            canon = _canonical(entry)
+            entry["_hash"] = prev = _entry_hash(canon, prev)
+            self._canon.append(canon)
+        self._tip_hash = prev
+        self._save()
+        log.info("Migrated %d history entries to the current chain format.",
+                 len(self.entries))
 
     def _save(self):
-        data = json.dumps({"entries": self.entries}).encode("utf-8")
+        data = _dumps({
+            "chain":   _GENESIS,
+            "anchor":  self._window_anchor,
+            "entries": self.entries,
+        })
         with open(HISTORY_DB, "wb") as f:
             f.write(_encrypt_blob(data))
 
@@ -71,7 +176,7 @@ class HistoryManager:
     def add(self, action: str, filename: str, status: str = "Success",
             algorithm: str = "AES-256-CBC", user: str = "", extra: dict | None = None):
         """Append one entry and re-save."""
-        prev_hash = self.entries[-1]["_hash"] if self.entries else "GENESIS"
+        prev_hash = self._tip_hash
 
         entry = {
             "action":    action,           # ENCRYPT | DECRYPT | SECURE_DELETE | …
@@ -80,56 +185,45 @@ class HistoryManager:
             "status":    status,           # Success | Failed
             "user":      user,
             "timestamp": datetime.now().isoformat(),
-            "display_time": datetime.now().strftime("%Y-%m-%d  %H:%M:%S"),
         }
         if extra:
             entry.update(extra)
 
-        entry["_hash"] = _entry_hash(
-            {k: v for k, v in entry.items() if k != "_hash"},
-            prev_hash,
-        )
+        canon = _canonical(entry)
+        entry["_hash"] = _entry_hash(canon, prev_hash)
         self.entries.append(entry)
+        self._canon.append(canon)
+        self._tip_hash = entry["_hash"]
 
-        # Trim oldest if over limit
+        # Trim oldest if over limit – the window now anchors to the hash of the
+        # last dropped entry, so the kept entries never need re-hashing.
         if len(self.entries) > self.MAX_ENTRIES:
-            # Re-chain after trim
+            self._window_anchor = self.entries[-self.MAX_ENTRIES - 1]["_hash"]
             self.entries = self.entries[-self.MAX_ENTRIES:]
-            self._rechain()
+            self._canon  = self._canon[-self.MAX_ENTRIES:]
 
         self._save()
 
     # ── verification ───────────────────────────────────────────────────────
     def verify_chain(self) -> tuple[bool, str]:
-        """Walk the chain and verify every HMAC.
+        """Walk the chain and verify every entry hash.
 
         Returns (intact, message).
         """
-        prev = "GENESIS"
-        for i, entry in enumerate(self.entries):
+        prev = self._window_anchor
+        for i, (entry, canon) in enumerate(zip(self.entries, self._canon)):
             stored_hash = entry.get("_hash", "")
-            computed    = _entry_hash(
-                {k: v for k, v in entry.items() if k != "_hash"},
-                prev,
-            )
+            computed    = _entry_hash(canon, prev)
             if stored_hash != computed:
-                return False, f"Chain broken at entry #{i} ({entry.get('display_time','?')})"
+                return False, f"Chain broken at entry #{i} ({display_time(entry)})"
             prev = stored_hash
         return True, f"Chain intact – {len(self.entries)} entries verified."
 
     # ── helpers ────────────────────────────────────────────────────────────
-    def _rechain(self):
-        """Re-compute HMACs for the entire list (after trim)."""
-        prev = "GENESIS"
-        for entry in self.entries:
-            entry["_hash"] = _entry_hash(
-                {k: v for k, v in entry.items() if k != "_hash"},
-                prev,
-            )
-            prev = entry["_hash"]
-
     def clear(self):
         self.entries = []
+        self._canon  = []
+        self._window_anchor = self._tip_hash = _GENESIS
         self._save()
 
     def get_all(self) -> list[dict]:
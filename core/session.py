@@ -7,7 +7,7 @@ Session & Panic management.
   • Inactivity auto-lock after SESSION_TIMEOUT seconds.
   • PANIC LOCK: instantly locks the app, wipes all temp files.
 
-CRITICAL FIX: Auto-lock now uses a polling mechanism instead of threading.Timer
+CRITICAL FIX: Auto-lock now uses Tk's own after() timer instead of threading.Timer
 to avoid "RuntimeError: main thread is not in main loop" when calling Tkinter
 methods from background threads.
 
@@ -20,13 +20,13 @@ Why the original failed:
 Correct approach:
 - No threading.Timer for UI callbacks
 - Session manager only tracks state (thread-safe)
-- UI layer polls session state using Tkinter's native event loop
+- UI layer schedules one after() job for seconds_until_timeout() and
+  re-arms it on activity (no per-second polling)
 - All Tkinter calls happen only on the main thread
 """
 
 import os, time, logging
 from core.config import SESSION_TIMEOUT, TEMP_DIR
-from core.crypto  import secure_delete_dir
 
 log = logging.getLogger("axcrypt.session")
 
@@ -44,6 +44,8 @@ class SessionManager:
         self.locked:   bool        = True
         self._last_activity: float = 0.0
         self._lock_requested: bool = False  # Flag for UI to poll
+        # Optional UI hook invoked by panic_lock() (set by the app window)
+        self.on_lock_requested = None
 
     # ── public API ─────────────────────────────────────────────────────────
     def login(self, username: str):
@@ -59,6 +61,8 @@ class SessionManager:
         self.username = None
         self.locked   = True
         self._lock_requested = False
+        from core.crypto import clear_key_cache
+        clear_key_cache()
         log.info("Session ended.")
 
     def touch(self):
@@ -70,6 +74,27 @@ class SessionManager:
             self._last_activity = time.time()
             self._lock_requested = False  # Cancel any pending lock
 
+    def seconds_until_timeout(self) -> float | None:
+        """Seconds left before inactivity auto-lock, or None while locked.
+
+        Lets the UI schedule a single timer for the deadline instead of
+        polling check_timeout() every second.
+        """
+        if self.locked:
+            return None
+        return max(0.0, SESSION_TIMEOUT - (time.time() - self._last_activity))
+
+    def _lock(self):
+        """Lock the session and drop every cached password-derived value.
+
+        Shared by the inactivity auto-lock and panic lock so no lock path
+        leaves keys in memory while the lock screen is up.
+        """
+        self.locked = True
+        self._lock_requested = True
+        from core.crypto import clear_key_cache
+        clear_key_cache()
+
     def is_locked(self) -> bool:
         """Check if the session is currently locked."""
         return self.locked
@@ -91,8 +116,7 @@ class SessionManager:
         
         if inactive_time >= SESSION_TIMEOUT and not self._lock_requested:
             log.info("Auto-lock: session inactive for %ds.", SESSION_TIMEOUT)
-            self.locked = True
-            self._lock_requested = True
+            self._lock()
             return True
         
         return False
@@ -116,8 +140,8 @@ class SessionManager:
         This method is thread-safe and can be called from any thread.
         It only sets flags - actual UI locking must be done by the UI layer.
         """
-        self.locked = True
-        self._lock_requested = True
+        self._lock()
+        from core.crypto import secure_delete_dir
 
         # Wipe temp directory (this is safe to do from any thread)
         try:
@@ -125,4 +149,7 @@ class SessionManager:
             os.makedirs(TEMP_DIR, exist_ok=True)
             log.warning("⚠️  PANIC LOCK triggered – temp files wiped.")
         except Exception as e:
-            log.error("Error during panic lock cleanup: %s", e)
\ No newline at end of file
+            log.error("Error during panic lock cleanup: %s", e)
+
+        if self.on_lock_requested is not None:
+            self.on_lock_requested()
\ No newline at end of file
@@ -6,13 +6,14 @@ Full authentication system:
   • Login    (brute-force lockout)
   • OTP generation & verification (mock – no external API)
   • Forgot-password reset via OTP
-  • All credentials stored encrypted on disk with AES-256
+  • All credentials stored encrypted on disk with AES-256-GCM
 """
 
-import os, json, time, secrets, logging, hashlib
+import os, json, time, secrets, logging, hashlib, hmac, functools, contextlib
+from collections import OrderedDict
 from datetime import datetime
 from core.config import (
-    USERS_DB, MAX_LOGIN_ATTEMPTS, LOCKOUT_SECS,
+    ensure_dirs, USERS_DB, MAX_LOGIN_ATTEMPTS, LOCKOUT_SECS,
     OTP_VALIDITY_SECS, OTP_LENGTH,
     SALT_SIZE, KEY_SIZE,
 )
@@ -21,14 +22,37 @@ from core.crypto import (
     secure_delete,
 )
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends             import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.padding   import PKCS7
 
 log = logging.getLogger("axcrypt.user")
 
+# ─── JSON for the encrypted DB blobs: orjson when installed (returns bytes),
+#     compact stdlib json otherwise.  Shared with core.history.
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    _loads = json.loads
+
 # ─── A fixed salt for the *database-level* encryption (not per-user passwords)
 _DB_SALT_FILE = os.path.join(os.path.dirname(USERS_DB), "db.salt")
 
+# ─── Hot, per-login fields live in a small side blob so a login does not
+#     re-encrypt and rewrite the whole users DB.
+_USERS_META_DB = USERS_DB + ".meta"
+
+# ─── Verified against for unknown usernames so a miss costs one KDF too.
+#     Zero salt ‖ zero key in hash_password()'s layout, so no KDF runs at
+#     start-up; verify_password() still derives (and never matches) it.
+_DUMMY_HASH = bytes(SALT_SIZE) + bytes(KEY_SIZE)
+
+# ─── Cap on usernames tracked for attempts / lockouts (oldest evicted first)
+_MAX_TRACKED_USERS = 10_000
 
+
+@functools.lru_cache(maxsize=1)
 def _get_db_salt() -> bytes:
     """Return (or create) the per-install salt used to wrap the users DB."""
     if os.path.exists(_DB_SALT_FILE):
@@ -40,60 +64,133 @@ def _get_db_salt() -> bytes:
     return salt
 
 
+@functools.lru_cache(maxsize=1)
 def _db_key() -> bytes:
     """Derive the AES key that encrypts the on-disk users blob.
-    Key is derived from the app-name string + per-install salt (no user secret).
+    Key is derived from the app-name string + per-install salt (no user secret),
+    so it is constant for the process and derived only once.
     """
     return derive_key("axcrypt_internal_db_wrap", _get_db_salt())
 
 
+# Blobs written by _encrypt_blob: MAGIC ‖ nonce(12) ‖ AES-256-GCM(ciphertext‖tag).
+# Anything without the magic is a legacy AES-256-CBC blob: iv(16) ‖ ciphertext.
+_BLOB_MAGIC = b"AXG1"
+_NONCE_SIZE = 12
+
+
+@functools.lru_cache(maxsize=1)
+def _aead() -> AESGCM:
+    """AES-GCM context for the DB wrap key (built once per process)."""
+    return AESGCM(_db_key())
+
+
 def _encrypt_blob(data: bytes) -> bytes:
-    iv  = secrets.token_bytes(16)
-    key = _db_key()
-    from cryptography.hazmat.primitives.padding import PKCS7
-    padder = PKCS7(128).padder()
-    padded = padder.update(data) + padder.finalize()
-    enc = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).encryptor()
-    return iv + enc.update(padded) + enc.finalize()
+    nonce = secrets.token_bytes(_NONCE_SIZE)
+    return _BLOB_MAGIC + nonce + _aead().encrypt(nonce, data, None)
 
 
 def _decrypt_blob(raw: bytes) -> bytes:
+    if raw[:len(_BLOB_MAGIC)] == _BLOB_MAGIC:
+        body = raw[len(_BLOB_MAGIC):]
+        return _aead().decrypt(body[:_NONCE_SIZE], body[_NONCE_SIZE:], None)
+    return _decrypt_blob_cbc(raw)
+
+
+def _decrypt_blob_cbc(raw: bytes) -> bytes:
+    """Read a blob written before the AES-GCM switch (re-saved as GCM)."""
     iv         = raw[:16]
     ciphertext = raw[16:]
     key        = _db_key()
-    dec = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).decryptor()
-    from cryptography.hazmat.primitives.padding import PKCS7
+    dec = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
     unpadder = PKCS7(128).unpadder()
     padded = dec.update(ciphertext) + dec.finalize()
     return unpadder.update(padded) + unpadder.finalize()
 
 
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write via <path>.tmp + fsync + os.replace so a crash never truncates *path*."""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Never leave a stray copy of the encrypted blob behind
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+def _remember(table: OrderedDict, key: str, value) -> None:
+    """Set *key* as most-recent in *table*, evicting the oldest past the cap."""
+    table[key] = value
+    table.move_to_end(key)
+    if len(table) > _MAX_TRACKED_USERS:
+        table.popitem(last=False)
+
+
 class UserManager:
     """In-memory cache of the encrypted users DB + auth helpers."""
 
     def __init__(self):
         self.users: dict = {}                   # username → record
-        self.login_attempts: dict[str, int]  = {}
-        self.lockout_until:  dict[str, float] = {}
-        self._pending_otps: dict[str, dict]  = {}   # mobile → {otp, expiry, purpose, username}
+        self.login_attempts: OrderedDict[str, int]   = OrderedDict()
+        self.lockout_until:  OrderedDict[str, float] = OrderedDict()   # time.monotonic() deadlines
+        self._pending_otps: dict[str, dict]  = {}   # mobile → {otp, expiry (monotonic), purpose, username}
+        ensure_dirs()
         self._load()
 
     # ── persistence ────────────────────────────────────────────────────────
     def _load(self):
-        if not os.path.exists(USERS_DB):
-            self.users = {}
-            return
-        try:
-            with open(USERS_DB, "rb") as f:
-                self.users = json.loads(_decrypt_blob(f.read()).decode("utf-8"))
-        except Exception as exc:
-            log.warning("Could not load users DB (first run?): %s", exc)
-            self.users = {}
+        self.users = {}
+        self._meta: dict[str, dict] = {}        # username → hot fields
+        if os.path.exists(USERS_DB):
+            try:
+                with open(USERS_DB, "rb") as f:
+                    self.users = _loads(_decrypt_blob(f.read()))
+            except Exception as exc:
+                log.warning("Could not load users DB (first run?): %s", exc)
+                self.users = {}
+        if os.path.exists(_USERS_META_DB):
+            try:
+                with open(_USERS_META_DB, "rb") as f:
+                    meta = _loads(_decrypt_blob(f.read()))
+                # Meta is newer than the main blob for these fields
+                for uname, fields in meta.items():
+                    if uname in self.users:
+                        self.users[uname].update(fields)
+                        self._meta[uname] = fields
+            except Exception as exc:
+                log.warning("Could not load users meta (ignored): %s", exc)
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Derived lookups over self.users (kept in sync by register/reset)."""
+        # Decoded password blobs – the DB keeps hex for JSON portability
+        self._pw_bytes: dict[str, bytes] = {
+            uname: bytes.fromhex(rec["password_hash"]) for uname, rec in self.users.items()
+        }
+        self._mobile_index: dict[str, str] = {}
+        for uname, rec in self.users.items():
+            if rec.get("mobile"):
+                self._mobile_index.setdefault(rec["mobile"], uname)   # first match wins
 
     def _save(self):
-        raw = json.dumps(self.users).encode("utf-8")
-        with open(USERS_DB, "wb") as f:
-            f.write(_encrypt_blob(raw))
+        raw = _dumps(self.users)
+        _atomic_write(USERS_DB, _encrypt_blob(raw))
+
+    def _save_meta(self):
+        """Persist only the hot per-login fields (see _USERS_META_DB)."""
+        raw = _dumps(self._meta)
+        _atomic_write(_USERS_META_DB, _encrypt_blob(raw))
+
+    def _touch_meta(self, username: str, **fields):
+        self.users[username].update(fields)
+        self._meta.setdefault(username, {}).update(fields)
+        self._save_meta()
 
     # ── registration ───────────────────────────────────────────────────────
     def register(self, username: str, password: str, email: str, mobile: str, fullname: str = ""):
@@ -113,14 +210,17 @@ class UserManager:
         if not mobile or len(mobile) < 7:
             return False, "Enter a valid mobile number."
 
+        pw_blob = hash_password(password)
         self.users[username] = {
-            "password_hash": hash_password(password).hex(),
+            "password_hash": pw_blob.hex(),
             "email":         email,
             "mobile":        mobile,
             "fullname":      fullname,
             "created_at":    datetime.now().isoformat(),
             "last_login":    None,
         }
+        self._mobile_index.setdefault(mobile, username)
+        self._pw_bytes[username] = pw_blob
         self._save()
         log.info("Registered user: %s", username)
         return True, "Registration successful."
@@ -130,26 +230,27 @@ class UserManager:
         """Returns (ok, message)."""
         # lockout check
         if username in self.lockout_until:
-            if time.time() < self.lockout_until[username]:
-                rem = int(self.lockout_until[username] - time.time())
+            if time.monotonic() < self.lockout_until[username]:
+                rem = int(self.lockout_until[username] - time.monotonic())
                 return False, f"Account locked. Try again in {rem}s."
             else:
                 del self.lockout_until[username]
-                self.login_attempts[username] = 0
+                _remember(self.login_attempts, username, 0)
 
         if username not in self.users:
+            # Equalise timing with the known-user path (no enumeration oracle)
+            verify_password(password, _DUMMY_HASH)
             return False, "Invalid username or password."
 
-        blob = bytes.fromhex(self.users[username]["password_hash"])
+        blob = self._pw_bytes[username]
         if verify_password(password, blob):
-            self.login_attempts[username] = 0
-            self.users[username]["last_login"] = datetime.now().isoformat()
-            self._save()
+            _remember(self.login_attempts, username, 0)
+            self._touch_meta(username, last_login=datetime.now().isoformat())
             return True, "Login successful."
 
-        self.login_attempts[username] = self.login_attempts.get(username, 0) + 1
+        _remember(self.login_attempts, username, self.login_attempts.get(username, 0) + 1)
         if self.login_attempts[username] >= MAX_LOGIN_ATTEMPTS:
-            self.lockout_until[username] = time.time() + LOCKOUT_SECS
+            _remember(self.lockout_until, username, time.monotonic() + LOCKOUT_SECS)
             return False, f"Too many failed attempts. Locked for {LOCKOUT_SECS}s."
         rem = MAX_LOGIN_ATTEMPTS - self.login_attempts[username]
         return False, f"Invalid credentials. {rem} attempt(s) left."
@@ -161,15 +262,17 @@ class UserManager:
         purpose: 'register' | 'reset'
         Returns the OTP string (mock – in production send via SMS gateway).
         """
-        otp = str(secrets.randbelow(10 ** OTP_LENGTH)).zfill(OTP_LENGTH)
+        otp_bytes = bytes(secrets.choice(b"0123456789") for _ in range(OTP_LENGTH))
+        otp = otp_bytes.decode("ascii")
         self._pending_otps[mobile] = {
-            "otp":      otp,
-            "expiry":   time.time() + OTP_VALIDITY_SECS,
+            "otp":      otp_bytes,              # kept as bytes for verify_otp
+            "expiry":   time.monotonic() + OTP_VALIDITY_SECS,
             "purpose":  purpose,
             "username": username,
             "attempts": 0,
         }
-        log.info("OTP generated for %s (purpose=%s): %s", mobile, purpose, otp)
+        # Never log the OTP value itself
+        log.debug("OTP generated for %s (purpose=%s)", mobile, purpose)
         # In production you would send SMS here.
         # For demo the OTP is displayed directly in the UI.
         return otp
@@ -179,14 +282,19 @@ class UserManager:
         record = self._pending_otps.get(mobile)
         if record is None:
             return False, "No pending OTP. Request a new one."
-        if time.time() > record["expiry"]:
+        if time.monotonic() > record["expiry"]:
             del self._pending_otps[mobile]
             return False, "OTP expired. Request a new one."
         record["attempts"] += 1
         if record["attempts"] > 3:
             del self._pending_otps[mobile]
             return False, "Too many wrong attempts. Request a new OTP."
-        if otp_entered.strip() != record["otp"]:
+        # Pad/truncate the input to OTP_LENGTH (the stored OTP is exactly that
+        # long) so a length mismatch cannot short-circuit compare_digest.
+        # The input length itself is not secret, so it is checked afterwards.
+        otp_entered = otp_entered.strip()
+        entered = otp_entered.encode("utf-8").ljust(OTP_LENGTH, b"\x00")[:OTP_LENGTH]
+        if not hmac.compare_digest(entered, record["otp"]) or len(otp_entered) != OTP_LENGTH:
             return False, "Incorrect OTP."
         # valid – leave record so caller can read purpose/username
         return True, "OTP verified."
@@ -204,7 +312,9 @@ class UserManager:
             return False, "User not found."
         if len(new_password) < 8:
             return False, "Password must be ≥ 8 characters."
-        self.users[username]["password_hash"] = hash_password(new_password).hex()
+        pw_blob = hash_password(new_password)
+        self.users[username]["password_hash"] = pw_blob.hex()
+        self._pw_bytes[username] = pw_blob
         self._save()
         # reset lockout
         self.login_attempts.pop(username, None)
@@ -220,7 +330,4 @@ class UserManager:
         return rec["mobile"] if rec else None
 
     def get_username_by_mobile(self, mobile: str) -> str | None:
-        for uname, rec in self.users.items():
-            if rec.get("mobile") == mobile:
-                return uname
-        return None
+        return self._mobile_index.get(mobile)
@@ -3,30 +3,51 @@
 AxCrypt v1.0.1 CustomTkinter - Main Entry Point
 FIXED: Single window initialization to prevent font errors
 """
-import sys, os, logging
+import sys, os, logging, logging.handlers, queue, atexit
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.config import LOG_FILE, APP_NAME
+from core.config import LOG_FILE, APP_NAME, ensure_dirs
 
 
 def _setup_logging():
     fmt = "%(asctime)s  [%(levelname)-8s] %(name)s: %(message)s"
-    handlers = [
+    formatter = logging.Formatter(fmt)
+    sinks = [
         logging.StreamHandler(sys.stdout),
         logging.FileHandler(LOG_FILE, encoding="utf-8"),
     ]
-    logging.basicConfig(level=logging.INFO, format=fmt, handlers=handlers)
+    for h in sinks:
+        h.setFormatter(formatter)
+
+    # Callers only enqueue; a listener thread does the blocking stdout/disk I/O
+    log_queue = queue.SimpleQueue()
+    listener  = logging.handlers.QueueListener(log_queue, *sinks, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    # QueueHandler pre-renders the message (+ traceback); sinks add the prefix
+    q_handler = logging.handlers.QueueHandler(log_queue)
+    q_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[q_handler])
 
 
 def main():
+    ensure_dirs()
     _setup_logging()
     log = logging.getLogger(APP_NAME)
     log.info("Starting %s CustomTkinter Edition…", APP_NAME)
 
+    # Needed by both the app and the error window; without it there is no
+    # window to report to, so log the failure and bail out.
     try:
         import customtkinter as ctk
-        from ui.splash import SplashScreen
+    except ImportError as exc:
+        log.critical("Fatal: %s", exc, exc_info=True)
+        sys.exit(1)
+
+    try:
+        # The splash is a Toplevel of the app root, so the root must exist
+        # first; ui.app is imported only once we are actually building it.
         from ui.app import AxCryptApp
         
         # FIXED: Create main app FIRST (this establishes the Tk root)
@@ -41,6 +62,7 @@ def main():
             app.show_auth()  # Start at auth screen
         
         # Pass app as root (splash will be Toplevel of app)
+        from ui.splash import SplashScreen
         splash = SplashScreen(app, on_splash_complete)
         
         # Start single event loop
@@ -48,7 +70,6 @@ def main():
         
     except Exception as exc:
         log.critical("Fatal: %s", exc, exc_info=True)
-        import customtkinter as ctk
         error_root = ctk.CTk()
         error_root.title("AxCrypt – Fatal Error")
         error_root.geometry("450x180")
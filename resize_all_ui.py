@@ -13,6 +13,8 @@ This will update all UI files in place with larger fonts and spacing.
 import re
 import os
 import shutil
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # 60% size increase
@@ -29,6 +31,12 @@ FILES_TO_UPDATE = [
     'ui/app.py',
 ]
 
+# Patterns are compiled once; all six dimension keywords share one alternation
+FONT_RE       = re.compile(r'font=\("([^"]+)",\s*(\d+)((?:,\s*"[^"]*")?)\)')
+TUPLE_FONT_RE = re.compile(r'\("([^"]+)",\s*(\d+)((?:,\s*"[^"]*")?)\)')
+PARAM_RE      = re.compile(r'\b(?P<p>width|height|padx|pady|ipadx|ipady)=(?P<v>\d+)\b')
+RESIZE_RE     = re.compile(r'resize\((\d+),\s*(\d+)\)')
+
 def backup_files():
     """Create backups before modification"""
     backup_dir = Path('ui_backups_original')
@@ -42,19 +50,24 @@ def backup_files():
     
     print(f'\n✓ Backups saved to {backup_dir}/\n')
 
+@functools.lru_cache(maxsize=None)
+def _scaled(value):
+    """int(value * SCALE), memoized – the same few sizes repeat constantly"""
+    return int(value * SCALE)
+
 def scale_font(match):
     """Scale font sizes by SCALE factor"""
     font_name = match.group(1)
     size = int(match.group(2))
     rest = match.group(3)
-    new_size = max(12, int(size * SCALE))  # Minimum 12px
+    new_size = max(12, _scaled(size))  # Minimum 12px
     return f'font=("{font_name}", {new_size}{rest})'
 
 def scale_size(match):
     """Scale dimensions by SCALE factor"""
-    param = match.group(1)
-    value = int(match.group(2))
-    new_value = int(value * SCALE)
+    param = match.group('p')
+    value = int(match.group('v'))
+    new_value = _scaled(value)
     return f'{param}={new_value}'
 
 def scale_tuple_font(match):
@@ -62,7 +75,7 @@ def scale_tuple_font(match):
     font_name = match.group(1)
     size = int(match.group(2))
     rest = match.group(3)
-    new_size = max(12, int(size * SCALE))
+    new_size = max(12, _scaled(size))
     return f'("{font_name}", {new_size}{rest})'
 
 def update_file(filepath):
@@ -77,31 +90,17 @@ def update_file(filepath):
     original_content = content
     
     # Scale font= parameters
-    content = re.sub(
-        r'font=\("([^"]+)",\s*(\d+)((?:,\s*"[^"]*")?)\)',
-        scale_font,
-        content
-    )
+    content = FONT_RE.sub(scale_font, content)
     
     # Scale tuple fonts in variables
-    content = re.sub(
-        r'\("([^"]+)",\s*(\d+)((?:,\s*"[^"]*")?)\)',
-        scale_tuple_font,
-        content
-    )
+    content = TUPLE_FONT_RE.sub(scale_tuple_font, content)
     
-    # Scale width, height, padx, pady, ipadx, ipady
-    for param in ['width', 'height', 'padx', 'pady', 'ipadx', 'ipady']:
-        content = re.sub(
-            rf'\b({param})=(\d+)\b',
-            scale_size,
-            content
-        )
+    # Scale width, height, padx, pady, ipadx, ipady (single pass)
+    content = PARAM_RE.sub(scale_size, content)
     
     # Scale resize() calls for images
-    content = re.sub(
-        r'resize\((\d+),\s*(\d+)\)',
-        lambda m: f'resize({int(int(m.group(1)) * SCALE)}, {int(int(m.group(2)) * SCALE)})',
+    content = RESIZE_RE.sub(
+        lambda m: f'resize({_scaled(int(m.group(1)))}, {_scaled(int(m.group(2)))})',
         content
     )
     
@@ -121,9 +120,10 @@ def main():
     # Backup first
     backup_files()
     
-    # Update each file
-    for filepath in FILES_TO_UPDATE:
-        update_file(filepath)
+    # Update each file (independent work – one worker process per file)
+    workers = min(len(FILES_TO_UPDATE), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(update_file, FILES_TO_UPDATE))
     
     print('\n' + '=' * 50)
     print('🎉 Resize complete!')
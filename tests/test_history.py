@@ -0,0 +1,71 @@
+"""History chain: entries written in the legacy format survive an upgrade."""
+
+import hmac, json, hashlib
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from core import history, user_manager
+
+
+@pytest.fixture
+def hist_paths(tmp_path, monkeypatch):
+    # Keep every on-disk artefact (db salt, chain key, history) in tmp_path
+    monkeypatch.setattr(user_manager, "_DB_SALT_FILE", str(tmp_path / "db.salt"))
+    for cached in (user_manager._get_db_salt, user_manager._db_key, user_manager._aead):
+        cached.cache_clear()
+    monkeypatch.setattr(history, "ensure_dirs", lambda: None)
+    monkeypatch.setattr(history, "HISTORY_DB", str(tmp_path / "history.axc"))
+    monkeypatch.setattr(history, "_CHAIN_KEY_FILE", str(tmp_path / "chain.key"))
+    monkeypatch.setattr(history, "_CHAIN_KEY_CACHE", None)
+    monkeypatch.setattr(history, "_HASH_TEMPLATE", None)
+    yield tmp_path
+    for cached in (user_manager._get_db_salt, user_manager._db_key, user_manager._aead):
+        cached.cache_clear()
+
+
+def _write_legacy_chain(n: int) -> list[dict]:
+    """Write *n* entries exactly as the original HMAC-SHA256 history did."""
+    key, prev, entries = history._chain_key(), "GENESIS", []
+    for i in range(n):
+        entry = {
+            "action": "ENCRYPT", "filename": f"file{i}.txt",
+            "algorithm": "AES-256-CBC", "status": "Success", "user": "alice",
+            "timestamp": f"2025-01-0{i + 1}T12:00:00",
+            "display_time": f"2025-01-0{i + 1}  12:00:00",
+        }
+        payload = json.dumps({"entry": entry, "prev": prev}, sort_keys=True)
+        entry["_hash"] = prev = hmac.new(key, payload.encode(), hashlib.sha256).hexdigest()
+        entries.append(entry)
+    raw = json.dumps({"entries": entries}).encode("utf-8")
+    with open(history.HISTORY_DB, "wb") as f:
+        f.write(history._encrypt_blob(raw))
+    return entries
+
+
+def test_legacy_chain_is_migrated(hist_paths):
+    legacy = _write_legacy_chain(3)
+
+    mgr = history.HistoryManager()
+    assert [e["filename"] for e in mgr.entries] == [e["filename"] for e in legacy]
+    assert mgr.verify_chain()[0]
+
+    # Migrated form is persisted and keeps verifying across reloads / appends
+    mgr.add("DECRYPT", "file0.txt", user="alice")
+    reloaded = history.HistoryManager()
+    assert len(reloaded.entries) == 4
+    assert reloaded.verify_chain()[0]
+
+
+def test_tampered_legacy_chain_is_kept_and_flagged(hist_paths):
+    _write_legacy_chain(3)
+    data = json.loads(history._decrypt_blob(open(history.HISTORY_DB, "rb").read()))
+    data["entries"][1]["filename"] = "forged.txt"
+    with open(history.HISTORY_DB, "wb") as f:
+        f.write(history._encrypt_blob(json.dumps(data).encode("utf-8")))
+
+    mgr = history.HistoryManager()
+    assert len(mgr.entries) == 3
+    intact, _ = mgr.verify_chain()
+    assert not intact
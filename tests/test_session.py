@@ -0,0 +1,21 @@
+"""Session locking: every lock path drops the cached password-derived keys."""
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from core import crypto, session
+from core.config import SESSION_TIMEOUT
+
+
+def test_auto_lock_clears_key_cache():
+    crypto.derive_key("hunter2", b"\x00" * 16)
+    assert crypto._derive_cached.cache_info().currsize == 1
+
+    mgr = session.SessionManager()
+    mgr.login("alice")
+    mgr._last_activity -= SESSION_TIMEOUT + 1
+
+    assert mgr.check_timeout()
+    assert mgr.is_locked()
+    assert crypto._derive_cached.cache_info().currsize == 0
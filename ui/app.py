@@ -14,24 +14,85 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import font as tkfont
 from PIL import Image
+from concurrent.futures import Future
+import functools
+import importlib
 import os
+import threading
 
 from core.config import APP_NAME, APP_TAGLINE, APP_VERSION, WIN_W, WIN_H, MIN_W, MIN_H, C, LOGO_PATH, FONTS
 from core.session import SessionManager
 from core.user_manager import UserManager
 from core.history import HistoryManager
-
-from ui.auth_panel_glassmorphism import AuthPanelGlassmorphic as AuthPanel
-from ui.lock_panel import LockPanel
-from ui.dashboard import DashboardPanel
-from ui.history_panel import HistoryPanel
-from ui.settings_panel import SettingsPanel
+from ui.widgets import NeonButton
+
+# Installed font families – enumerating the registry is slow, so once per process
+_FONT_FAMILIES_CACHE: set[str] | None = None
+
+
+def _get_font_families(root) -> set[str]:
+    global _FONT_FAMILIES_CACHE
+    if _FONT_FAMILIES_CACHE is None:
+        _FONT_FAMILIES_CACHE = set(tkfont.families(root))
+    return _FONT_FAMILIES_CACHE
+
+
+# Footer tabs: (icon, name, palette key) – colours resolved once per window
+_FOOTER_TABS = (
+    ("📊", "DASHBOARD", "neon_cyan"),
+    ("🔐", "ENCRYPT",   "neon_green"),
+    ("🔓", "DECRYPT",   "neon_cyan"),
+    ("📜", "HISTORY",   "neon_violet"),
+    ("⚙️", "SETTINGS",  "neon_orange"),
+)
+
+# Panels are imported and built on first use (see AxCryptApp._get_panel)
+_PANEL_SPECS = {
+    "AUTH":      ("ui.auth_panel_glassmorphism", "AuthPanelGlassmorphic"),
+    "LOCK":      ("ui.lock_panel",               "LockPanel"),
+    "DASHBOARD": ("ui.dashboard",                "DashboardPanel"),
+    "HISTORY":   ("ui.history_panel",            "HistoryPanel"),
+    "SETTINGS":  ("ui.settings_panel",           "SettingsPanel"),
+    "ENCRYPT":   ("ui.encrypt_panel",            "EncryptPanel"),
+    "DECRYPT":   ("ui.decrypt_panel",            "DecryptPanel"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _panel_class(name: str):
+    """Import a panel's module on first request and memoize its class."""
+    module_name, cls_name = _PANEL_SPECS[name]
+    return getattr(importlib.import_module(module_name), cls_name)
 
 # Set CustomTkinter appearance mode
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
 
+# Largest logo size the window needs (the 64×64 icon)
+_LOGO_MASTER_SIZE = (64, 64)
+
+
+@functools.lru_cache(maxsize=2)
+def _load_logo_master(path: str) -> Image.Image:
+    """Decode a logo file once, pre-reduced to the largest size in use."""
+    img = Image.open(path)
+    img.load()
+    img = img.convert("RGBA")
+    # BILINEAR + reducing_gap box-reduces first, then resamples: visually the
+    # same as LANCZOS at icon sizes for a fraction of the CPU.
+    img.thumbnail(_LOGO_MASTER_SIZE, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    return img
+
+
+@functools.lru_cache(maxsize=8)
+def _load_logo(path: str, size: tuple[int, int]) -> Image.Image:
+    """Derive one logo size from the shared master; reused across windows."""
+    img = _load_logo_master(path).copy()
+    img.thumbnail(size, Image.Resampling.BILINEAR)
+    return img
+
+
 class AxCryptApp(ctk.CTk):
     """
     Root application window with CustomTkinter:
@@ -43,9 +104,33 @@ class AxCryptApp(ctk.CTk):
     - Main-thread-safe auto-lock mechanism
     """
 
+    # (path, size) → CTkImage, shared by every window in the process
+    _ctk_image_cache: dict = {}
+
     def __init__(self):
         super().__init__()
 
+        # ═══ Widget / Panel Slots ═══
+        # Declared up front so later code tests "is None" instead of hasattr()
+        self.nav_frame = None
+        self.footer_frame = None
+        self.footer_buttons = None
+        self._panels = {}
+        # Lazy-loaded heavy panels (for performance)
+        self._encrypt_panel = None
+        self._decrypt_panel = None
+        self._active_panel = None
+        self._active_tab = None
+        self._auto_lock_job = None
+        # Tab name → zero-arg panel getter; one dict lookup per switch
+        self._tab_factories = {
+            "DASHBOARD": functools.partial(self._get_panel, "DASHBOARD"),
+            "ENCRYPT":   self._get_encrypt_panel,
+            "DECRYPT":   self._get_decrypt_panel,
+            "HISTORY":   functools.partial(self._get_panel, "HISTORY"),
+            "SETTINGS":  functools.partial(self._get_panel, "SETTINGS"),
+        }
+
         # ═══ Shared State ═══
         self.session = SessionManager()
         self.user_mgr = UserManager()
@@ -59,8 +144,8 @@ class AxCryptApp(ctk.CTk):
         self.configure(fg_color=C["bg_deep"])
         self.resizable(True, True)
 
-        # Set window icon
-        self._set_window_icon()
+        # Window icon + header logo decode off the main thread
+        self._load_icon_async()
 
         # ═══ Professional Fonts ═══
         self._setup_fonts()
@@ -70,53 +155,74 @@ class AxCryptApp(ctk.CTk):
         
         # Footer navigation bar (persistent)
         self.footer_frame = ctk.CTkFrame(self, fg_color=C["bg_panel"], height=52, corner_radius=0)
-        self.footer_frame.pack(side="bottom", fill="x")
         self.footer_frame.pack_propagate(False)
         self._build_footer()
+        self.footer_frame.pack(side="bottom", fill="x")
         
         self.content = ctk.CTkFrame(self, fg_color=C["bg_deep"], corner_radius=0)
         self.content.pack(fill="both", expand=True)
 
-        # ═══ Panel Registry ═══
-        # Pre-loaded panels
-        self.auth_panel = AuthPanel(self)
-        self.lock_panel = LockPanel(self)
-        self.dashboard_panel = DashboardPanel(self)
-        self.history_panel = HistoryPanel(self)
-        self.settings_panel = SettingsPanel(self)
-
-        # Lazy-loaded heavy panels (for performance)
-        self._encrypt_panel = None
-        self._decrypt_panel = None
-
-        self._active_panel = None
-        self._active_tab = None
-
-        # ═══ Auto-Lock Polling ═══
-        self._auto_lock_job = None
+        # ═══ Auto-Lock Timer ═══
+        # Panels are built on first use – only the auth panel is needed at startup
         self._start_auto_lock_polling()
 
+        # Settle every pending geometry request in a single layout pass
+        self.update_idletasks()
+
     # ═══════════════════════════════════════════════════════════════
     # INITIALIZATION HELPERS
     # ═══════════════════════════════════════════════════════════════
 
-    def _set_window_icon(self):
-        """Set application icon from logo"""
+    _HEADER_LOGO_KEY = (LOGO_PATH, (48, 48))
+
+    def _load_icon_async(self):
+        """Decode the logo sizes on a worker thread so the window maps at once.
+
+        The worker never touches Tk: it fills a Future that the main thread
+        picks up from an after() callback, as with the panels' UI queues.
+        """
+        if not os.path.exists(LOGO_PATH):
+            return  # Fallback to system default
+        result = Future()
+
+        def _decode():
+            try:
+                result.set_result((_load_logo(LOGO_PATH, (64, 64)),
+                                   _load_logo(*self._HEADER_LOGO_KEY)))
+            except Exception as e:
+                result.set_exception(e)
+
+        threading.Thread(target=_decode, daemon=True).start()
+        self.after(10, self._install_icon, result)
+
+    def _install_icon(self, result: Future):
+        """Main thread: wrap the decoded images and hand them to Tk."""
+        if not result.done():
+            self.after(10, self._install_icon, result)
+            return
         try:
-            if os.path.exists(LOGO_PATH):
-                # For CustomTkinter, we need to use tk.PhotoImage or PIL
-                from PIL import ImageTk
-                logo_img = Image.open(LOGO_PATH)
-                logo_img = logo_img.resize((64, 64), Image.Resampling.LANCZOS)
-                self.logo_icon = ImageTk.PhotoImage(logo_img)
-                self.iconphoto(True, self.logo_icon)
+            icon_img, header_img = result.result()
+            from PIL import ImageTk
+            # PhotoImage is bound to this Tk interpreter, so it stays per-window
+            self.logo_icon = ImageTk.PhotoImage(icon_img)
+            self.iconphoto(True, self.logo_icon)
         except Exception:
-            pass  # Fallback to system default
+            # Fallback to system default icon and the emoji header mark
+            self.header_logo_label.configure(text="🛡️")
+            return
+        key = self._HEADER_LOGO_KEY
+        if key not in self._ctk_image_cache:
+            self._ctk_image_cache[key] = ctk.CTkImage(dark_image=header_img, size=(48, 48))
+        self._show_header_logo()
+
+    def _show_header_logo(self):
+        self.header_logo_img = self._ctk_image_cache[self._HEADER_LOGO_KEY]
+        self.header_logo_label.configure(image=self.header_logo_img, text="")
 
     def _setup_fonts(self):
         """Configure professional font stack"""
         try:
-            available_fonts = tkfont.families()
+            available_fonts = _get_font_families(self)
             
             if "Segoe UI" in available_fonts:
                 primary_family = "Segoe UI"
@@ -131,16 +237,29 @@ class AxCryptApp(ctk.CTk):
             primary_family = "Helvetica"
             mono_family = "Courier"
 
-        # Global font tuples (family, size, weight)
-        self.font_heading    = (primary_family, 16, "bold")
-        self.font_subheading = (primary_family, 13, "bold")
-        self.font_body       = (primary_family, 11)
-        self.font_body_bold  = (primary_family, 11, "bold")
-        self.font_small      = (primary_family, 10)
-        self.font_tiny       = (primary_family, 9)
-        self.font_mono       = (mono_family,    10)
-        self.font_button     = (primary_family, 10, "bold")
-        self.font_tab        = (primary_family, 10, "bold")
+        # Shared CTkFont objects – one Tk named font per style instead of a
+        # fresh font per widget built from a bare tuple
+        def _font(family, size, weight="normal"):
+            return ctk.CTkFont(family=family, size=size, weight=weight)
+
+        self.font_heading    = _font(primary_family, 16, "bold")
+        self.font_subheading = _font(primary_family, 13, "bold")
+        self.font_body       = _font(primary_family, 11)
+        self.font_body_bold  = _font(primary_family, 11, "bold")
+        self.font_small      = _font(primary_family, 10)
+        self.font_tiny       = _font(primary_family, 9)
+        self.font_mono       = _font(mono_family,    10)
+        self.font_button     = _font(primary_family, 10, "bold")
+        self.font_tab        = _font(primary_family, 10, "bold")
+        # Header styles
+        self.font_logo       = _font(primary_family, 22)
+        self.font_title      = _font(primary_family, 20, "bold")
+        self.font_user       = _font(primary_family, 12, "bold")
+
+        # Prime Tk's metric cache once so later text measurement is a hit
+        for f in (self.font_body, self.font_small, self.font_tab,
+                  self.font_title, self.font_user):
+            f.metrics("linespace")
 
     # ═══════════════════════════════════════════════════════════════
     # HEADER
@@ -148,42 +267,33 @@ class AxCryptApp(ctk.CTk):
 
     def _build_header(self):
         """Build application header with logo and status"""
+        # Children are packed into the unmapped frame; hdr itself is packed
+        # last so the whole header is laid out in one pass
         hdr = ctk.CTkFrame(self, fg_color=C["bg_panel"], height=60, corner_radius=0)
-        hdr.pack(fill="x")
         hdr.pack_propagate(False)
 
         # Left: Logo + Branding
-        logo_frame = ctk.CTkFrame(hdr, fg_color=C["bg_panel"], corner_radius=0)
+        logo_frame = ctk.CTkFrame(hdr, fg_color="transparent", corner_radius=0)
         logo_frame.pack(side="left", padx=(20, 0))
 
-        # Logo image
-        try:
-            if os.path.exists(LOGO_PATH):
-                img = Image.open(LOGO_PATH)
-                img = img.resize((48, 48), Image.Resampling.LANCZOS)
-                self.header_logo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(48, 48))
-                ctk.CTkLabel(
-                    logo_frame, 
-                    image=self.header_logo_img,
-                    text="",
-                    fg_color=C["bg_panel"]
-                ).pack(side="left", padx=(0, 10))
-        except Exception:
-            # Fallback emoji
-            ctk.CTkLabel(
-                logo_frame,
-                text="🛡️",
-                font=("Segoe UI", 22),
-                fg_color=C["bg_panel"],
-                text_color=C["neon_cyan"]
-            ).pack(side="left", padx=(0, 8))
+        # Logo image – placeholder until _install_icon delivers the decode;
+        # shows the fallback emoji when there is no logo file at all
+        self.header_logo_label = ctk.CTkLabel(
+            logo_frame,
+            text="" if os.path.exists(LOGO_PATH) else "🛡️",
+            width=48,
+            font=self.font_logo,
+            text_color=C["neon_cyan"]
+        )
+        self.header_logo_label.pack(side="left", padx=(0, 10))
+        if self._HEADER_LOGO_KEY in self._ctk_image_cache:
+            self._show_header_logo()
 
         # App name
         ctk.CTkLabel(
             logo_frame,
             text=APP_NAME,
-            font=("Segoe UI", 20, "bold"),
-            fg_color=C["bg_panel"],
+            font=self.font_title,
             text_color=C["text_white"]
         ).pack(side="left", padx=(0, 0))
 
@@ -191,21 +301,19 @@ class AxCryptApp(ctk.CTk):
         ctk.CTkLabel(
             logo_frame,
             text=APP_TAGLINE,
-            font=("Segoe UI", 11),
-            fg_color=C["bg_panel"],
+            font=self.font_body,
             text_color=C["text_mid"]
         ).pack(side="left", padx=(12, 0))
 
 
         # Right: Version + User
-        self.header_right = ctk.CTkFrame(hdr, fg_color=C["bg_panel"], corner_radius=0)
+        self.header_right = ctk.CTkFrame(hdr, fg_color="transparent", corner_radius=0)
         self.header_right.pack(side="right", padx=(0, 20))
 
         ctk.CTkLabel(
             self.header_right,
             text=f"v{APP_VERSION}",
-            font=("Segoe UI", 10),
-            fg_color=C["bg_panel"],
+            font=self.font_small,
             text_color=C["text_mid"]
         ).pack(side="right", padx=(0, 10))
 
@@ -213,40 +321,30 @@ class AxCryptApp(ctk.CTk):
         self.user_label = ctk.CTkLabel(
             self.header_right,
             text="",
-            font=("Segoe UI", 12, "bold"),
-            fg_color=C["bg_panel"],
+            font=self.font_user,
             text_color=C["neon_green"]
         )
         self.user_label.pack(side="right", padx=(10, 0))
 
+        hdr.pack(fill="x")
+
         # Border
         ctk.CTkFrame(self, fg_color=C["border"], height=1, corner_radius=0).pack(fill="x")
 
     def _build_footer(self):
-        """Build persistent footer navigation bar"""
-        # Clear existing widgets
-        for w in self.footer_frame.winfo_children():
-            w.destroy()
+        """Build persistent footer navigation bar (once; later updates go
+        through _update_footer_highlight's configure() calls)."""
+        if self.footer_buttons is not None:
+            return
+        self.footer_buttons = {}
+        self._footer_colors = {name: C[key] for _, name, key in _FOOTER_TABS}
         
         # Add top border separator
         ctk.CTkFrame(self.footer_frame, fg_color=C["border"], height=1, corner_radius=0).pack(side="top", fill="x")
         
-        # Define footer tabs
-        tabs = [
-            ("📊", "DASHBOARD", C["neon_cyan"]),
-            ("🔐", "ENCRYPT", C["neon_green"]),
-            ("🔓", "DECRYPT", C["neon_cyan"]),
-            ("📜", "HISTORY", C["neon_violet"]),
-            ("⚙️", "SETTINGS", C["neon_orange"]),
-        ]
-        
-        # Store footer buttons for later updates
-        if not hasattr(self, 'footer_buttons'):
-            self.footer_buttons = {}
-        
         # Create footer tab buttons
-        for icon, name, color in tabs:
-            btn_frame = ctk.CTkFrame(self.footer_frame, fg_color=C["bg_panel"], corner_radius=0)
+        for icon, name, _ in _FOOTER_TABS:
+            btn_frame = ctk.CTkFrame(self.footer_frame, fg_color="transparent", corner_radius=0)
             btn_frame.pack(side="left", fill="both", expand=True)
             
             btn = ctk.CTkButton(
@@ -261,13 +359,14 @@ class AxCryptApp(ctk.CTk):
                 command=lambda n=name: self._switch_tab(n)
             )
             btn.pack(fill="both", expand=True, padx=9, pady=14)
-            self.footer_buttons[name] = (btn, color)
+            self.footer_buttons[name] = btn
 
     def _update_footer_highlight(self):
         """Update footer button highlights based on active tab"""
-        for name, (btn, color) in self.footer_buttons.items():
-            if name == self._active_tab:
-                btn.configure(fg_color=C["bg_card"], text_color=color)
+        active, colors = self._active_tab, self._footer_colors
+        for name, btn in self.footer_buttons.items():
+            if name == active:
+                btn.configure(fg_color=C["bg_card"], text_color=colors[name])
             else:
                 btn.configure(fg_color="transparent", text_color=C["text_mid"])
 
@@ -275,23 +374,22 @@ class AxCryptApp(ctk.CTk):
     # NAVIGATION
     # ═══════════════════════════════════════════════════════════════
 
-    _TABS = [
+    _TABS = (
         ("DASHBOARD", "📊"),
         ("ENCRYPT", "🔐"),
         ("DECRYPT", "🔓"),
         ("HISTORY", "📜"),
         ("SETTINGS", "⚙️"),
-    ]
+    )
 
     def _build_nav(self):
         """Build top navigation bar (shown after login)"""
+        if self.nav_frame is None:
+            return
         # Clear existing nav
         for w in self.nav_frame.winfo_children():
             w.destroy()
 
-        # Import NeonButton from widgets
-        from ui.widgets import NeonButton
-
         # Action buttons on right
         panic_btn = NeonButton(
             self.nav_frame,
@@ -330,42 +428,44 @@ class AxCryptApp(ctk.CTk):
     # PANEL SWITCHING
     # ═══════════════════════════════════════════════════════════════
 
+    def _get_panel(self, name: str):
+        """Return the named panel, importing + constructing it on first use."""
+        panel = self._panels.get(name)
+        if panel is None:
+            panel = self._panels[name] = _panel_class(name)(self)
+        return panel
+
+    def _get_encrypt_panel(self):
+        """Encrypt panel – lazy, and dropped again on logout."""
+        if self._encrypt_panel is None:
+            self._encrypt_panel = _panel_class("ENCRYPT")(self)
+        return self._encrypt_panel
+
+    def _get_decrypt_panel(self):
+        """Decrypt panel – lazy, and dropped again on logout."""
+        if self._decrypt_panel is None:
+            self._decrypt_panel = _panel_class("DECRYPT")(self)
+        return self._decrypt_panel
+
+    @property
+    def dashboard_panel(self):
+        return self._get_panel("DASHBOARD")
+
     def _switch_tab(self, tab_name: str):
         """Switch to a specific tab with proper state management."""
         self.session.touch()
-        self._hide_all_panels()
+        self._reschedule_auto_lock()
 
         self._active_tab = tab_name
 
-        # Get panel (lazy-load encrypt/decrypt for performance)
-        panel_map = {
-            "DASHBOARD": self.dashboard_panel,
-            "HISTORY": self.history_panel,
-            "SETTINGS": self.settings_panel,
-        }
-
-        if tab_name == "ENCRYPT":
-            if self._encrypt_panel is None:
-                from ui.encrypt_panel import EncryptPanel
-                self._encrypt_panel = EncryptPanel(self)
-            panel = self._encrypt_panel
-
-        elif tab_name == "DECRYPT":
-            if self._decrypt_panel is None:
-                from ui.decrypt_panel import DecryptPanel
-                self._decrypt_panel = DecryptPanel(self)
-            panel = self._decrypt_panel
-
-        else:
-            panel = panel_map[tab_name]
+        panel = self._tab_factories[tab_name]()
 
         # Reset panel state before showing
         if hasattr(panel, "reset_state"):
             panel.reset_state()
 
         # Show panel
-        panel.show()
-        self._active_panel = panel
+        self._swap_panel(panel)
 
         # Call on_show hook if available
         if hasattr(panel, "on_show"):
@@ -375,26 +475,32 @@ class AxCryptApp(ctk.CTk):
         self._update_footer_highlight()
 
     def _hide_all_panels(self):
-        """Hide all panels"""
-        panels = []
-        if hasattr(self, 'auth_panel'):
-            panels.append(self.auth_panel)
-        if hasattr(self, 'lock_panel'):
-            panels.append(self.lock_panel)
-        if hasattr(self, 'dashboard_panel'):
-            panels.append(self.dashboard_panel)
-        if hasattr(self, 'history_panel'):
-            panels.append(self.history_panel)
-        if hasattr(self, 'settings_panel'):
-            panels.append(self.settings_panel)
-        
-        for p in panels:
-            p.hide()
-
-        if hasattr(self, '_encrypt_panel') and self._encrypt_panel:
-            self._encrypt_panel.hide()
-        if hasattr(self, '_decrypt_panel') and self._decrypt_panel:
-            self._decrypt_panel.hide()
+        """Hide whatever is on screen.
+
+        Only one panel is ever visible, so hiding the active one suffices –
+        no redundant pack_forget() on panels that are already hidden.
+        """
+        if self._active_panel is not None:
+            self._active_panel.hide()
+            self._active_panel = None
+
+    def _swap_panel(self, panel):
+        """Replace the visible panel with *panel* in one hide/show pair.
+
+        Re-selecting the tab already on screen costs no relayout at all.
+        Full tear-down paths (auth/lock) still go through _hide_all_panels.
+        """
+        active = self._active_panel
+        if active is panel:
+            return
+        if active is not None:
+            active.hide()
+        self._show_panel(panel)
+
+    def _show_panel(self, panel):
+        """Show *panel* and record it as the one to hide next."""
+        panel.show()
+        self._active_panel = panel
 
     # ═══════════════════════════════════════════════════════════════
     # PUBLIC NAVIGATION METHODS
@@ -403,17 +509,17 @@ class AxCryptApp(ctk.CTk):
     def show_auth(self):
         self._hide_all_panels()
         # Hide footer nav on auth screen
-        if hasattr(self, "footer_frame"):
+        if self.footer_frame is not None:
             self.footer_frame.pack_forget()
-        self.auth_panel.show()
+        self._show_panel(self._get_panel("AUTH"))
 
 
     def show_lock(self):
         self._hide_all_panels()
         # Hide footer nav during lock screen
-        if hasattr(self, "footer_frame"):
+        if self.footer_frame is not None:
             self.footer_frame.pack_forget()
-        self.lock_panel.show()
+        self._show_panel(self._get_panel("LOCK"))
 
 
     def show_main(self, username: str):
@@ -432,32 +538,51 @@ class AxCryptApp(ctk.CTk):
     # ═══════════════════════════════════════════════════════════════
 
     def _start_auto_lock_polling(self):
-        """Start polling for auto-lock condition using CTk's event loop."""
-        self._check_auto_lock()
+        """Arm event-driven auto-lock: one timer per inactivity deadline."""
+        self._cancel_auto_lock()
+        self.session.on_lock_requested = self._on_lock_requested
+        self._reschedule_auto_lock()
+
+    def _cancel_auto_lock(self):
+        """Drop the pending auto-lock timer so at most one chain ever runs."""
+        if self._auto_lock_job is not None:
+            self.after_cancel(self._auto_lock_job)
+            self._auto_lock_job = None
+
+    def _reschedule_auto_lock(self):
+        """(Re)arm the auto-lock timer for the session's current deadline."""
+        self._cancel_auto_lock()
+        remaining = self.session.seconds_until_timeout()
+        if remaining is not None:
+            self._auto_lock_job = self.after(int(remaining * 1000) + 1, self._check_auto_lock)
+
+    def _on_lock_requested(self):
+        """Session hook for panic lock – hand the UI work to the event loop."""
+        self.after_idle(self._do_lock_screen)
 
     def _check_auto_lock(self):
-        """Periodic check for auto-lock condition."""
+        """Fires at the inactivity deadline."""
+        self._auto_lock_job = None
         try:
             if self.session.check_timeout():
                 self._do_lock_screen()
-            elif self.session.is_lock_requested() and not self.session.is_locked():
-                self.session.locked = True
-                self._do_lock_screen()
+            else:
+                # Activity since the timer was armed – wait for the new deadline
+                self._reschedule_auto_lock()
         except Exception as e:
             import logging
             logging.getLogger("axcrypt.app").error("Auto-lock check error: %s", e, exc_info=True)
-        finally:
-            # Always reschedule — never let the polling die silently
-            self._auto_lock_job = self.after(1000, self._check_auto_lock)
 
     def _do_lock_screen(self):
         """Execute lock screen transition."""
+        # A panic lock can land while the inactivity timer is still armed
+        self._cancel_auto_lock()
         self._hide_all_panels()
         # Hide footer nav during lock screen
-        if hasattr(self, "footer_frame"):
+        if self.footer_frame is not None:
             self.footer_frame.pack_forget()
         self.user_label.configure(text="")
-        self.lock_panel.show()
+        self._show_panel(self._get_panel("LOCK"))
         self.session.clear_lock_request()
 
     # ═══════════════════════════════════════════════════════════════
@@ -471,9 +596,14 @@ class AxCryptApp(ctk.CTk):
     def _logout(self):
         """Logout and return to auth screen"""
         self.session.logout()
-        
-        # Clean up heavy panels
+        self._cancel_auto_lock()
+        self.show_auth()
+
+        # Clean up heavy panels – destroy (not just drop) them so their
+        # widgets, timers and the decrypt panel's wake pipe are released.
+        # Done after show_auth() so the active one is hidden first.
+        for panel in (self._encrypt_panel, self._decrypt_panel):
+            if panel is not None:
+                panel.destroy()
         self._encrypt_panel = None
-        self._decrypt_panel = None
-        
-        self.show_auth()
\ No newline at end of file
+        self._decrypt_panel = None
\ No newline at end of file
@@ -15,77 +15,213 @@ FEATURES:
 
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import messagebox, Canvas
-from PIL import Image
+from tkinter import Canvas
+from concurrent.futures import Future
 import os
 import random
-import math
+import threading
 from core.config import C, LOGO_PATH
 
 
 class AnimatedBackground(Canvas):
     """Animated gradient background with floating particles."""
-    
+
+    FRAME_MS = 33          # ~30 fps while on screen
+    IDLE_MS = 500          # re-check interval while minimized / obscured
+    COUNT = 30             # particles on screen
+    RESET_POOL = 256       # pre-drawn x positions for particles that wrap
+    # Speed bands, 0.3 – 1.0 px per frame in 1/256 px (8.8 fixed point).
+    # Every particle rides one band and each band moves as a single canvas
+    # tag, so a frame costs one move() per band rather than one per particle.
+    BAND_SPEEDS_Q8 = (77, 137, 196, 256)
+    BAND_TAGS = tuple(f"band{b}" for b in range(len(BAND_SPEEDS_Q8)))
+
     def __init__(self, master):
         super().__init__(
             master,
             bg=C["bg_deep"],
             highlightthickness=0
         )
-        self.particles = []
+        # Canvas size, kept current by <Configure> – no winfo_* reads per frame
+        self._w, self._h = 1400, 900
+        self.bind("<Configure>", self._on_resize)
+        # Fully covered by another window → nothing to draw
+        self._visible = True
+        self.bind("<Visibility>", self._on_visibility)
+        self._after_id = None
+        self._running = True
+        # Safety net: never leave a timer chain behind a destroyed canvas
+        self.bind("<Destroy>", lambda e: self.stop())
+        # Particle state as parallel lists: y is stored relative to the
+        # particle's band offset (band offsets are 8.8 fixed point)
+        self._ids, self._xs, self._ys, self._bands = [], [], [], []
+        self._band_q8 = [0] * len(self.BAND_SPEEDS_Q8)
+        self._refill_reset_xs()
         self._create_particles()
         self._animate()
-    
+
+    def start(self):
+        """(Re)start the animation loop after stop()."""
+        self._running = True
+        if self._after_id is None:
+            self._animate()
+
+    def stop(self):
+        """Halt the animation loop (the auth screen is no longer shown)."""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _on_resize(self, event):
+        """Track the canvas size; redraw the wrap-x pool if the width moved much."""
+        old_w = self._w
+        self._w, self._h = event.width, event.height
+        if abs(event.width - old_w) > old_w // 10:
+            self._refill_reset_xs()
+
+    def _on_visibility(self, event):
+        self._visible = event.state != "VisibilityFullyObscured"
+
+    def _refill_reset_xs(self):
+        """Draw a fresh batch of wrap-around x positions for the current width."""
+        self._reset_xs = random.choices(range(max(self._w, 1) + 1), k=self.RESET_POOL)
+        self._reset_idx = 0
+
     def _create_particles(self):
         """Create floating particles."""
-        for _ in range(30):
-            x = random.randint(0, 1400)
-            y = random.randint(0, 900)
-            size = random.randint(2, 5)
-            speed = random.uniform(0.3, 1.0)
-            color = random.choice([C["neon_cyan"], C["neon_violet"], C["neon_green"], C["neon_pink"]])
-            
-            particle = {
-                'id': self.create_oval(x, y, x+size, y+size, fill=color, outline=""),
-                'x': x,
-                'y': y,
-                'speed': speed,
-                'color': color
-            }
-            self.particles.append(particle)
+        n = self.COUNT
+        # One batched draw per attribute instead of four RNG calls per particle
+        xs = random.choices(range(1401), k=n)
+        ys = random.choices(range(901), k=n)
+        sizes = random.choices(range(2, 6), k=n)
+        colors = random.choices([C["neon_cyan"], C["neon_violet"], C["neon_green"], C["neon_pink"]], k=n)
+        bands = random.choices(range(len(self.BAND_SPEEDS_Q8)), k=n)
+
+        tags = self.BAND_TAGS
+        for x, y, size, color, band in zip(xs, ys, sizes, colors, bands):
+            self._ids.append(self.create_oval(x, y, x+size, y+size, fill=color, outline="", tags=tags[band]))
+        self._xs, self._ys, self._bands = xs, ys, bands
     
     def _animate(self):
-        """Animate particles."""
+        """Animate particles.
+
+        Each speed band is translated with one move() on its tag, and only on
+        frames where it crosses a whole pixel. Per-particle canvas calls are
+        limited to the occasional wrap from the top back to the bottom.
+        """
+        if not self._running or not self.winfo_exists():
+            return
         try:
-            for particle in self.particles:
-                # Move particle up
-                particle['y'] -= particle['speed']
-                
-                # Reset if goes off screen
-                if particle['y'] < -10:
-                    particle['y'] = self.winfo_height() + 10
-                    particle['x'] = random.randint(0, max(self.winfo_width(), 1))
-                
-                # Update position
-                self.coords(
-                    particle['id'],
-                    particle['x'], particle['y'],
-                    particle['x']+3, particle['y']+3
-                )
-            
-            # Schedule next frame
-            self.after(50, self._animate)
-        except:
-            pass
+            # Minimized (an unmapped ancestor) or fully obscured: slow re-check
+            if not self._visible or not self.winfo_viewable():
+                self._after_id = self.after(self.IDLE_MS, self._animate)
+                return
+
+            move = self.move
+            offsets = self._band_q8
+            moved = False
+            for b, (tag, speed) in enumerate(zip(self.BAND_TAGS, self.BAND_SPEEDS_Q8)):
+                # Move the band up
+                old = offsets[b]
+                new = offsets[b] = old - speed
+                dy = (old >> 8) - (new >> 8)
+                if dy:
+                    move(tag, 0, -dy)
+                    moved = True
+
+            if moved:
+                # Reset particles that went off screen – teleport to a new x
+                # below the bottom
+                off_px = [o >> 8 for o in offsets]
+                xs, ys = self._xs, self._ys
+                bottom = self._h + 10
+                for i, (pid, b) in enumerate(zip(self._ids, self._bands)):
+                    y = ys[i] + off_px[b]
+                    if y < -10:
+                        if self._reset_idx == self.RESET_POOL:
+                            self._refill_reset_xs()
+                        x = self._reset_xs[self._reset_idx]
+                        self._reset_idx += 1
+                        move(pid, x - xs[i], bottom - y)
+                        xs[i] = x
+                        ys[i] = bottom - off_px[b]
+        except tk.TclError:
+            # Canvas torn down mid-frame – end the loop, don't reschedule
+            self._after_id = None
+            return
+
+        # Schedule next frame
+        self._after_id = self.after(self.FRAME_MS, self._animate)
 
 
 class AuthPanelGlassmorphic:
     """Stunning modern authentication panel."""
+
+    # Logo never changes – decode/resize once per process, not per rebuild.
+    # The PIL work runs on a worker thread (_LOGO_DECODE); the CTkImage is
+    # built on the Tk thread the first time the result is picked up.
+    _LOGO_EXISTS = None
+    _LOGO_DECODE = None
+    _LOGO_CACHE = None
+
+    # (tab, is_active) → configure() kwargs, resolved from C once
+    _TAB_STYLES = {
+        ("login", True):   {"fg_color": C["neon_cyan"]},
+        ("login", False):  {"fg_color": "transparent"},
+        ("signup", True):  {"fg_color": C["neon_green"]},
+        ("signup", False): {"fg_color": "transparent"},
+    }
+
+    @classmethod
+    def _preload_logo(cls):
+        """Start decoding the 70×70 logo in the background (once per process)."""
+        if cls._LOGO_EXISTS is None:
+            cls._LOGO_EXISTS = os.path.exists(LOGO_PATH)
+        if not cls._LOGO_EXISTS or cls._LOGO_DECODE is not None:
+            return
+        result = cls._LOGO_DECODE = Future()
+
+        def _decode():
+            try:
+                from PIL import Image
+                img = Image.open(LOGO_PATH)
+                result.set_result(img.resize((70, 70), Image.Resampling.LANCZOS))
+            except Exception as e:
+                result.set_exception(e)
+
+        threading.Thread(target=_decode, daemon=True).start()
+
+    def _try_set_logo(self):
+        """Swap the emoji placeholder for the logo once the decode is done."""
+        cls = type(self)
+        result = cls._LOGO_DECODE
+        if result is None:
+            return  # No logo file – keep the emoji
+        if not result.done():
+            self.container.after(100, self._try_set_logo)
+            return
+        if cls._LOGO_CACHE is None:
+            try:
+                img = result.result()
+            except Exception:
+                return
+            cls._LOGO_CACHE = ctk.CTkImage(light_image=img, dark_image=img, size=(70, 70))
+        self._logo_label.configure(image=cls._LOGO_CACHE, text="")
     
     def __init__(self, app):
         self.app = app
         self.container = None
         self._current_mode = "login"
+        # Mode the on-screen form was built for; rebuilds are coalesced on idle
+        self._built_mode = None
+        self._rebuild_pending = False
+        # Bumped per form build so deferred signup fields never land in a
+        # form that has since been replaced
+        self._form_gen = 0
         
         # Input fields
         self.username_entry = None
@@ -93,39 +229,46 @@ class AuthPanelGlassmorphic:
         self.email_entry = None
         self.mobile_entry = None
         self.fullname_entry = None
+
+        self._preload_logo()
     
     def show(self):
         """Display the authentication panel."""
-        if self.container:
-            self.container.pack_forget()
-        
         # Hide footer navigation during auth
         if hasattr(self.app, 'footer_frame'):
             self.app.footer_frame.pack_forget()
         
-        self.container = ctk.CTkFrame(
-            self.app.content,
-            fg_color=C["bg_deep"],
-            corner_radius=0
-        )
+        # Chrome (background, card, tabs) is built once and kept across shows
+        if self.container is None:
+            self.container = ctk.CTkFrame(
+                self.app.content,
+                fg_color=C["bg_deep"],
+                corner_radius=0
+            )
+            self._build_chrome()
+        else:
+            self.bg_canvas.start()
+
+        # Fresh form every time, so no credentials linger from the last login.
+        # Everything is packed into the unmapped container first, then one
+        # update_idletasks() settles the whole screen in a single layout pass.
+        self._build_form()
         self.container.pack(fill="both", expand=True)
-        
-        self._build_ui()
+        self.container.update_idletasks()
     
     def hide(self):
         """Hide the authentication panel."""
         if self.container:
+            # Particles are invisible past the login screen – stop the timer
+            self.bg_canvas.stop()
             self.container.pack_forget()
         
         # Show footer when leaving auth
         if hasattr(self.app, 'footer_frame'):
             self.app.footer_frame.pack(side="bottom", fill="x")
     
-    def _build_ui(self):
-        """Build the stunning auth UI."""
-        for widget in self.container.winfo_children():
-            widget.destroy()
-        
+    def _build_chrome(self):
+        """Build the parts of the auth UI that never change with the mode."""
         # ═══════════════════════════════════════════════════
         # ANIMATED BACKGROUND
         # ═══════════════════════════════════════════════════
@@ -153,6 +296,7 @@ class AuthPanelGlassmorphic:
             width=480,
             height=580
         )
+        # Fixed-size card: children never push their size back up to it
         main_card.pack(padx=20, pady=20)
         main_card.pack_propagate(False)
         
@@ -167,19 +311,15 @@ class AuthPanelGlassmorphic:
         logo_frame = ctk.CTkFrame(content, fg_color="transparent")
         logo_frame.pack(pady=(0, 10))
         
-        try:
-            if os.path.exists(LOGO_PATH):
-                img = Image.open(LOGO_PATH)
-                img = img.resize((70, 70), Image.Resampling.LANCZOS)
-                logo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(70, 70))
-                ctk.CTkLabel(logo_frame, image=logo_img, text="").pack()
-        except Exception:
-            ctk.CTkLabel(
-                logo_frame,
-                text="🛡️",
-                font=("Segoe UI", 40),
-                text_color=C["neon_cyan"]
-            ).pack()
+        # Emoji placeholder until the background decode delivers the logo
+        self._logo_label = ctk.CTkLabel(
+            logo_frame,
+            text="🛡️",
+            font=("Segoe UI", 40),
+            text_color=C["neon_cyan"]
+        )
+        self._logo_label.pack()
+        self._try_set_logo()
         
         # App name with glow
         ctk.CTkLabel(
@@ -200,21 +340,20 @@ class AuthPanelGlassmorphic:
         # MODERN TAB SWITCHER
         # ═══════════════════════════════════════════════════
         
+        # Sized by its buttons (36 px + 2×5 px padding)
         tab_container = ctk.CTkFrame(
             content,
             fg_color=C["bg_input"],
-            corner_radius=10,
-            height=44
+            corner_radius=10
         )
         tab_container.pack(fill="x", pady=(0, 15))
-        tab_container.pack_propagate(False)
         
         # Login tab
         self.login_tab = ctk.CTkButton(
             tab_container,
             text="🔐 Login",
             font=("Segoe UI", 12, "bold"),
-            fg_color=C["neon_cyan"] if self._current_mode == "login" else "transparent",
+            fg_color="transparent",
             hover_color=C["bg_hover"],
             text_color=C["text_white"],
             corner_radius=8,
@@ -228,7 +367,7 @@ class AuthPanelGlassmorphic:
             tab_container,
             text="✨ Sign Up",
             font=("Segoe UI", 12, "bold"),
-            fg_color=C["neon_green"] if self._current_mode == "signup" else "transparent",
+            fg_color="transparent",
             hover_color=C["bg_hover"],
             text_color=C["text_white"],
             corner_radius=8,
@@ -238,23 +377,14 @@ class AuthPanelGlassmorphic:
         self.signup_tab.pack(side="left", fill="both", expand=True, padx=5, pady=5)
         
         # ═══════════════════════════════════════════════════
-        # FORM FIELDS (Scrollable)
+        # FORM FIELDS
         # ═══════════════════════════════════════════════════
         
-        # Scrollable frame for forms
-        form_scroll = ctk.CTkScrollableFrame(
-            content,
-            fg_color="transparent",
-            height=220
-        )
-        form_scroll.pack(fill="both", expand=True)
-        
-        self.form_container = form_scroll
-        
-        if self._current_mode == "login":
-            self._build_login_form()
-        else:
-            self._build_signup_form()
+        # Host for the per-mode form frames (see _form_frame)
+        self._form_host = ctk.CTkFrame(content, fg_color="transparent")
+        self._form_host.pack(fill="both", expand=True)
+        self._form_frames = {}
+        self.form_container = None
         
         # ═══════════════════════════════════════════════════
         # GUEST ACCESS
@@ -272,7 +402,49 @@ class AuthPanelGlassmorphic:
             command=self._continue_as_guest
         )
         guest_btn.pack(fill="x", pady=(15, 0))
+
+    def _form_frame(self, mode):
+        """Frame hosting *mode*'s form, created on first use.
+
+        Login (2 fields) always fits, so it gets a plain frame; only signup
+        (5 fields) pays for a CTkScrollableFrame's canvas and scroll bindings.
+        """
+        frame = self._form_frames.get(mode)
+        if frame is None:
+            if mode == "signup":
+                frame = ctk.CTkScrollableFrame(self._form_host, fg_color="transparent", height=220)
+            else:
+                frame = ctk.CTkFrame(self._form_host, fg_color="transparent")
+            self._form_frames[mode] = frame
+        return frame
+
+    def _build_form(self):
+        """(Re)build only the form for the current mode."""
+        frame = self._form_frame(self._current_mode)
+        if frame is not self.form_container:
+            if self.form_container is not None:
+                self.form_container.pack_forget()
+            frame.pack(fill="both", expand=True)
+            self.form_container = frame
+        for widget in frame.winfo_children():
+            widget.destroy()
+        self._form_gen += 1
+
+        if self._built_mode != self._current_mode:
+            self._update_tabs()
+        self._built_mode = self._current_mode
+
+        if self._current_mode == "login":
+            self._build_login_form()
+        else:
+            self._build_signup_form()
     
+    def _update_tabs(self):
+        """Move the highlight between the two long-lived tab buttons."""
+        login = self._current_mode == "login"
+        self.login_tab.configure(**self._TAB_STYLES["login", login])
+        self.signup_tab.configure(**self._TAB_STYLES["signup", not login])
+
     def _build_login_form(self):
         """Build login form."""
         # Username
@@ -292,6 +464,10 @@ class AuthPanelGlassmorphic:
             True
         )
         self.password_entry = self.last_entry
+
+        # Enter walks username → password → login; start typing right away
+        self._chain_return((self.username_entry, self.password_entry), self._handle_login)
+        self.username_entry.focus_set()
         
         # Login button
         login_btn = ctk.CTkButton(
@@ -319,7 +495,11 @@ class AuthPanelGlassmorphic:
         ).pack()
     
     def _build_signup_form(self):
-        """Build signup form."""
+        """Build signup form.
+
+        The first two fields are built now; the rest follow on idle so Tk can
+        paint the visible top of the form first.
+        """
         # Full Name
         self._create_input(self.form_container, "Full Name", "Your full name", False)
         self.fullname_entry = self.last_entry
@@ -327,7 +507,18 @@ class AuthPanelGlassmorphic:
         # Username
         self._create_input(self.form_container, "Username", "Choose username", False)
         self.username_entry = self.last_entry
-        
+
+        # Not there until _build_signup_form_rest runs
+        self.email_entry = self.mobile_entry = self.password_entry = None
+        self._chain_return((self.fullname_entry, self.username_entry))
+        self.fullname_entry.focus_set()
+        self.form_container.after_idle(self._build_signup_form_rest, self._form_gen)
+
+    def _build_signup_form_rest(self, gen):
+        """Remaining signup fields + submit button (deferred)."""
+        if gen != self._form_gen:
+            return  # Form was rebuilt or switched in the meantime
+
         # Email
         self._create_input(self.form_container, "Email", "your@email.com", False)
         self.email_entry = self.last_entry
@@ -339,6 +530,11 @@ class AuthPanelGlassmorphic:
         # Password
         self._create_input(self.form_container, "Password", "Strong password", True)
         self.password_entry = self.last_entry
+
+        self._chain_return(
+            (self.username_entry, self.email_entry, self.mobile_entry, self.password_entry),
+            self._handle_signup
+        )
         
         # Signup button
         signup_btn = ctk.CTkButton(
@@ -354,6 +550,15 @@ class AuthPanelGlassmorphic:
         )
         signup_btn.pack(fill="x", pady=(20, 0))
     
+    @staticmethod
+    def _chain_return(entries, submit=None):
+        """Bind <Return> so each entry moves focus to the next; the last one
+        calls *submit* (if given)."""
+        for entry, nxt in zip(entries, entries[1:]):
+            entry.bind("<Return>", lambda e, nxt=nxt: nxt.focus_set())
+        if submit is not None:
+            entries[-1].bind("<Return>", lambda e: submit())
+
     def _create_input(self, parent, label, placeholder, is_password):
         """Create a styled input field."""
         ctk.CTkLabel(
@@ -382,13 +587,23 @@ class AuthPanelGlassmorphic:
         self.last_entry = entry
     
     def _switch_mode(self, mode):
-        """Switch between login and signup."""
-        if self._current_mode != mode:
-            self._current_mode = mode
-            self._build_ui()
+        """Switch between login and signup.
+
+        Rapid clicks within one event-loop tick collapse into one rebuild.
+        """
+        self._current_mode = mode
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            self.app.after_idle(self._do_rebuild)
+
+    def _do_rebuild(self):
+        self._rebuild_pending = False
+        if self._built_mode != self._current_mode:
+            self._build_form()
     
     def _continue_as_guest(self):
         """Continue as guest."""
+        from tkinter import messagebox
         result = messagebox.askyesno(
             "Guest Access",
             "Continue as Guest?\n\n"
@@ -405,6 +620,7 @@ class AuthPanelGlassmorphic:
     
     def _forgot_password(self):
         """Handle forgot password."""
+        from tkinter import messagebox
         username = ctk.CTkInputDialog(
             text="Enter your username for password reset:",
             title="Forgot Password"
@@ -458,6 +674,7 @@ class AuthPanelGlassmorphic:
     
     def _handle_login(self):
         """Handle login."""
+        from tkinter import messagebox
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
         
@@ -474,6 +691,9 @@ class AuthPanelGlassmorphic:
     
     def _handle_signup(self):
         """Handle signup."""
+        from tkinter import messagebox
+        if self.password_entry is None:
+            return  # Deferred fields not built yet
         fullname = self.fullname_entry.get().strip()
         username = self.username_entry.get().strip()
         email = self.email_entry.get().strip()
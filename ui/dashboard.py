@@ -10,6 +10,7 @@ Dashboard – first screen after login.
 
 import tkinter as tk
 from core.config import C
+from core.history import display_time
 from ui.widgets  import CardFrame, TerminalText, NeonButton
 
 
@@ -140,7 +141,7 @@ class DashboardPanel(tk.Frame):
                 action = entry.get("action", "?")
                 fname  = entry.get("filename", "?")
                 status = entry.get("status", "?")
-                ts     = entry.get("display_time", "?")
+                ts     = display_time(entry)
                 tag    = "success" if status == "Success" else "danger"
                 self._activity.print(f"  [{ts}]  {action:16s} {fname:40s} [{status}]", tag=tag)
 
@@ -10,11 +10,13 @@ DECRYPT tab.
 
 CRITICAL FIX: Thread-safe UI updates using queue-based dispatcher
 - Worker thread emits events to queue
-- Main thread polls queue and updates UI
+- Main thread drains queue and updates UI (woken through a self-pipe where
+  Tk supports file handlers, otherwise by polling)
 - NO Tkinter calls from background threads
 """
 
-import os, tkinter as tk, threading, time, random, queue
+import os, tkinter as tk, threading, time, itertools, collections, secrets
+import tkinter.filedialog as fd
 from core.config import C
 from core.crypto import (
     decrypt_file, encrypt_file, secure_delete,
@@ -25,21 +27,63 @@ from ui.widgets import (
     NeonButton, DarkEntry, CardFrame, NeonProgressBar, TerminalText
 )
 
+# Decorative "byte stream" lines, generated once at import and cycled
+_HEX_LINES = itertools.cycle([
+    "  " + os.urandom(24).hex(" ") for _ in range(256)
+])
+
 
 class DecryptPanel(tk.Frame):
 
+    # Stage bar fill animation: widths for 0 %, 12 %, … 96 % of 120 px,
+    # one step per 25 ms tick
+    _FILL_WIDTHS = tuple(int(120 * pct / 100) for pct in range(0, 101, 12))
+    _FILL_TICK_MS = 25
+
     def __init__(self, app):
         super().__init__(app.content, bg=C["bg_deep"])
         self.app = app
         self._selected_file = ""
+        self._selected_basename = ""
+        self._selected_stat = None
         self._is_processing = False
+        # Anything changed since the last reset_state()? (clean → skip it)
+        self._dirty = False
+        self._last_frac = 0.0
+        # Stage index → next _FILL_WIDTHS step; one shared timer drives them all
+        self._anim_state = {}
+        self._anim_job = None
+        # Pending debounced token validation (see _check_token)
+        self._token_after = None
         
-        # Thread-safe queue for worker -> main thread communication
-        self.ui_queue = queue.Queue()
+        # Worker -> main thread messages. Single producer / single consumer:
+        # deque.append / popleft are atomic, so no Queue locks are needed.
+        self.ui_queue = collections.deque()
         self._poll_job = None
+
+        # Self-pipe: the worker writes a byte after each message and Tk's file
+        # handler wakes the main loop only then – no idle polling. Tk on
+        # Windows has no createfilehandler, so it falls back to the poll.
+        self._wake_r = self._wake_w = None
+        # Guards _wake_w between a worker's _post() and destroy() closing it
+        self._wake_lock = threading.Lock()
+        if hasattr(self.tk, "createfilehandler"):
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+            self.tk.createfilehandler(self._wake_r, tk.READABLE, self._drain_queue)
         
         self._build_ui()
 
+        # Message type → handler (see _handle_ui_message)
+        self._dispatch = {
+            "stage":         self._handle_stage,
+            "progress":      lambda m: self._update_progress(m[1]),
+            "complete":      self._handle_complete,
+            "enable_button": self._handle_enable,
+            "steg":          self._handle_steg,
+        }
+
     # ══════════════════════════════════════════════════════════════════════
     # LAYOUT
     # ══════════════════════════════════════════════════════════════════════
@@ -108,6 +152,7 @@ class DecryptPanel(tk.Frame):
         tk.Checkbutton(del_row, variable=self._del_after_var, text="",
                        bg=C["bg_deep"], activebackground=C["bg_deep"],
                        fg=C["neon_orange"], selectcolor=C["bg_input"],
+                       command=self._mark_dirty,
                        ).pack(side="left")
         tk.Label(del_row, text="🗑️ Secure-delete decrypted file after viewing",
                  font=("Arial", 10), bg=C["bg_deep"], fg=C["neon_orange"]).pack(side="left")
@@ -185,9 +230,20 @@ class DecryptPanel(tk.Frame):
     def on_show(self):
         pass
 
+    def _mark_dirty(self):
+        self._dirty = True
+
     def reset_state(self):
         """Reset all UI state - called when switching tabs"""
+        # Already pristine (the usual case when just passing through the tab)
+        # – skip the dozens of configure() calls below. The entry is checked
+        # too since a mouse paste fires no <KeyRelease>.
+        if not self._dirty and not self._pwd_entry.get():
+            return
+        self._dirty = False
         self._selected_file = ""
+        self._selected_basename = ""
+        self._selected_stat = None
         self._file_label.configure(text="No file selected", fg=C["text_dim"])
         self._steg_card.pack_forget()
         self._pwd_entry.set("")
@@ -202,34 +258,83 @@ class DecryptPanel(tk.Frame):
         self._is_processing = False
         
         # Stop polling if active
-        if self._poll_job:
-            self.after_cancel(self._poll_job)
-            self._poll_job = None
+        self._stop_ui_polling()
+        if self._token_after is not None:
+            self.after_cancel(self._token_after)
+            self._token_after = None
+
+    def destroy(self):
+        self._stop_ui_polling()
+        for job in (self._token_after, self._anim_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._token_after = self._anim_job = None
+        if self._wake_r is not None:
+            self.tk.deletefilehandler(self._wake_r)
+            with self._wake_lock:
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._wake_r = self._wake_w = None
+        super().destroy()
 
     # ══════════════════════════════════════════════════════════════════════
     # FILE / TOKEN
     # ══════════════════════════════════════════════════════════════════════
     def _browse_file(self):
-        import tkinter.filedialog as fd
         path = fd.askopenfilename(title="Select encrypted file",
                                   filetypes=[("All files", "*.*"), ("Encrypted files", "*.enc")])
         if path:
+            self._dirty = True
             self._selected_file = path
-            self._file_label.configure(text=os.path.basename(path), fg=C["neon_cyan"])
-
-            # Try read steganographic metadata
+            self._selected_basename = os.path.basename(path)
+            # One stat at selection time stands in for later exists() checks
+            try:
+                self._selected_stat = os.stat(path)
+            except OSError:
+                self._selected_stat = None
+            self._file_label.configure(text=self._selected_basename, fg=C["neon_cyan"])
+
+            # Read steganographic metadata off the Tk thread; the card pops
+            # in via the "steg" message once the file has been scanned
+            self._steg_card.pack_forget()
+            self._start_ui_polling()
+            threading.Thread(target=self._read_steg_bg, args=(path,), daemon=True).start()
+
+    def _read_steg_bg(self, path: str):
+        """Worker thread - NO Tkinter calls."""
+        try:
             meta = read_steg_metadata(path)
-            if meta and "owner" in meta:
-                import time as _t
-                ts = meta.get("ts", 19)
-                when = _t.strftime("%Y-%m-%d %H:%M", _t.localtime(ts)) if ts else "unknown"
-                txt = f"Owner: {meta['owner']}  (Encrypted: {when})"
-                self._steg_label.configure(text=txt, fg=C["neon_violet"])
-                self._steg_card.pack(fill="x", pady=(0, 10), after=self._file_label.master.master)
-            else:
-                self._steg_card.pack_forget()
+        except Exception:
+            meta = None
+        self._post(("steg", path, meta))
+
+    def _handle_steg(self, msg):
+        _, path, meta = msg
+        if not self._is_processing:
+            self._stop_ui_polling()
+        if path != self._selected_file:
+            return  # Stale result – another file was picked meanwhile
+        if meta and "owner" in meta:
+            ts = meta.get("ts", 19)
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(ts)) if ts else "unknown"
+            txt = f"Owner: {meta['owner']}  (Encrypted: {when})"
+            self._steg_label.configure(text=txt, fg=C["neon_violet"])
+            self._steg_card.pack(fill="x", pady=(0, 10), after=self._file_label.master.master)
 
     def _check_token(self, _e=None):
+        """Validate a time-locked token 300 ms after the last keystroke."""
+        self._dirty = True
+        if self._token_after is not None:
+            self.after_cancel(self._token_after)
+            self._token_after = None
+        val = self._pwd_entry.get().strip()
+        if "." in val and len(val) > 50:
+            self._token_after = self.after(300, self._do_check_token)
+        else:
+            self._token_status.configure(text="")
+
+    def _do_check_token(self):
+        self._token_after = None
         val = self._pwd_entry.get().strip()
         if "." in val and len(val) > 50:
             try:
@@ -249,8 +354,9 @@ class DecryptPanel(tk.Frame):
     def _start_decrypt(self):
         if self._is_processing:
             return  # Already processing
+        self._dirty = True
             
-        if not self._selected_file or not os.path.exists(self._selected_file):
+        if not self._selected_file or self._selected_stat is None:
             self._status.configure(text="⚠ Select an encrypted file.", fg=C["danger"])
             return
         pwd = self._pwd_entry.get().strip()
@@ -297,26 +403,32 @@ class DecryptPanel(tk.Frame):
         
         Correct approach:
         - Worker emits events: ("stage", idx, msg), ("progress", frac), ("complete", ...)
-        - Main thread polls queue using root.after() and updates UI
+        - Main thread drains the queue (pipe wake-up or after() poll) and updates UI
         - Zero direct Tkinter calls from this thread
         """
-        src = self._selected_file
+        src, src_name = self._selected_file, self._selected_basename
 
         try:
             # Stage 0: Key derivation
-            self.ui_queue.put(("stage", 0, "Deriving key …"))
-            time.sleep(0.5)
+            self._post(("stage", 0, "Deriving key …"))
 
             # Stage 1: Header parse
-            self.ui_queue.put(("stage", 1, "Parsing file header …"))
-            time.sleep(0.3)
+            self._post(("stage", 1, "Parsing file header …"))
 
             # Stage 2: Decryption
-            self.ui_queue.put(("stage", 2, "Decrypting …"))
+            self._post(("stage", 2, "Decrypting …"))
+
+            # Thread-safe progress callback - NO Tkinter calls.
+            # Throttled to ~30 events/s or 1% steps; 100% is always forwarded.
+            last = [0.0, 0]  # frac, monotonic_ns of the last forwarded event
 
-            # Thread-safe progress callback - NO Tkinter calls
             def _progress(frac):
-                self.ui_queue.put(("progress", frac))
+                now = time.monotonic_ns()
+                if frac < 1.0 and frac - last[0] < 0.01 and now - last[1] < 33_000_000:
+                    return
+                last[0] = frac
+                last[1] = now
+                self._post(("progress", frac))
 
             # Perform actual decryption
             # Perform actual decryption (in-place: replaces encrypted file)
@@ -331,56 +443,90 @@ class DecryptPanel(tk.Frame):
                                                     output_path=output_path)
 
             # If successful, delete the encrypted file (clean up)
-            if ok and os.path.exists(src) and output_path != src:
+            if ok and output_path != src:
                 try:
                     os.remove(src)  # Delete the .enc file
                 except Exception:
                     pass  # Ignore cleanup errors
 
             # Stage 3: Output
-            self.ui_queue.put(("stage", 3, "Writing output …"))
-            time.sleep(0.3)
+            self._post(("stage", 3, "Writing output …"))
 
             # Send completion event to main thread
             if ok:
-                self.app.history.add("DECRYPT", os.path.basename(src),
+                self.app.history.add("DECRYPT", src_name,
                                      status="Success", user=self.app.session.username or "",
                                      extra={"otd": was_otd, "output": out_path})
-                self.ui_queue.put(("complete", True, out_path, was_otd))
+                self._post(("complete", True, out_path, was_otd))
             else:
-                self.app.history.add("DECRYPT", os.path.basename(src),
+                self.app.history.add("DECRYPT", src_name,
                                      status="Failed", user=self.app.session.username or "")
-                self.ui_queue.put(("complete", False, err, None))
+                self._post(("complete", False, err, None))
                 
         except Exception as e:
-            self.ui_queue.put(("complete", False, f"Unexpected error: {str(e)}", None))
+            self._post(("complete", False, f"Unexpected error: {str(e)}", None))
         finally:
             self._is_processing = False
-            self.ui_queue.put(("enable_button",))
+            self._post(("enable_button",))
+
+    def _post(self, msg):
+        """Worker side: queue a UI message and wake the main loop."""
+        self.ui_queue.append(msg)
+        # Under the lock so destroy() cannot close (and the OS reuse) the fd
+        # between the check and the write
+        with self._wake_lock:
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"\x01")
+                except (BlockingIOError, OSError):
+                    pass  # Pipe full – a wake-up is already pending
 
     def _start_ui_polling(self):
         """Start polling the queue for UI updates - runs on main thread"""
-        self._poll_ui_queue()
+        if self._wake_r is None and self._poll_job is None:
+            self._poll_ui_queue()
 
-    def _poll_ui_queue(self):
+    def _stop_ui_polling(self):
+        if self._poll_job:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+
+    def _drain_queue(self, fileno=None, mask=None):
         """
-        Main thread dispatcher - polls queue and updates UI.
-        
-        This method runs on the main thread via after() scheduling.
-        All Tkinter calls are safe here.
+        Main thread dispatcher - empties the queue and updates UI.
+
+        Called by Tk's file handler when the worker wakes the pipe (or by
+        the fallback poll). All Tkinter calls are safe here.
         """
+        if fileno is not None:
+            try:
+                os.read(fileno, 4096)
+            except BlockingIOError:
+                pass
+        # Process all pending messages in queue. A run of progress updates
+        # coalesces to its latest value (one bar repaint per run), flushed
+        # before the next other message so "complete" still lands last.
+        latest_progress = None
+        while True:
+            try:
+                msg = self.ui_queue.popleft()
+            except IndexError:
+                break
+            if msg[0] == "progress":
+                latest_progress = msg[1]
+                continue
+            if latest_progress is not None:
+                self._update_progress(latest_progress)
+                latest_progress = None
+            self._handle_ui_message(msg)
+        if latest_progress is not None:
+            self._update_progress(latest_progress)
+
+    def _poll_ui_queue(self):
+        """Fallback when Tk has no file handlers: drain every 50 ms."""
         try:
-            # Process all pending messages in queue
-            while True:
-                try:
-                    msg = self.ui_queue.get_nowait()
-                    self._handle_ui_message(msg)
-                except queue.Empty:
-                    break
-            
-            # Schedule next poll (50ms intervals for smooth updates)
+            self._drain_queue()
             self._poll_job = self.after(50, self._poll_ui_queue)
-            
         except tk.TclError:
             # Widget destroyed, stop polling
             self._poll_job = None
@@ -390,53 +536,45 @@ class DecryptPanel(tk.Frame):
         Handle messages from worker thread - runs on main thread.
         
         All Tkinter calls are safe here because this method is only called
-        from _poll_ui_queue, which runs on the main thread.
+        from _drain_queue, which runs on the main thread.
         """
-        msg_type = msg[0]
-        
-        if msg_type == "stage":
-            # Animate a decryption stage
-            idx = msg[1]
-            stage_msg = msg[2]
-            self._animate_stage(idx, stage_msg)
-        
-        elif msg_type == "progress":
-            # Update progress bar
-            frac = msg[1]
-            self._update_progress(frac)
-        
-        elif msg_type == "complete":
-            # Decryption finished
-            success = msg[1]
-            result = msg[2]
-            was_otd = msg[3]
-            
-            # Stop polling
-            if self._poll_job:
-                self.after_cancel(self._poll_job)
-                self._poll_job = None
-            
-            # Update UI based on result
-            if success:
-                self._finish_ok(result, was_otd)
-            else:
-                self._finish_fail(result)
-        
-        elif msg_type == "enable_button":
-            # Re-enable decrypt button
-            self._decrypt_btn.configure(
-                state="normal", 
-                bg=self._decrypt_btn._dark, 
-                cursor="hand2"
-            )
+        self._dirty = True
+        self._dispatch[msg[0]](msg)
+
+    def _handle_stage(self, msg):
+        # Animate a decryption stage
+        _, idx, stage_msg = msg
+        self._animate_stage(idx, stage_msg)
+
+    def _handle_complete(self, msg):
+        # Decryption finished
+        _, success, result, was_otd = msg
+
+        # Stop polling
+        self._stop_ui_polling()
+
+        # Update UI based on result
+        if success:
+            self._finish_ok(result, was_otd)
+        else:
+            self._finish_fail(result)
+
+    def _handle_enable(self, _msg=None):
+        # Re-enable decrypt button
+        self._decrypt_btn.configure(
+            state="normal", 
+            bg=self._decrypt_btn._dark, 
+            cursor="hand2"
+        )
 
     def _finish_ok(self, out_path: str, was_otd: bool):
         """
         Handle successful decryption - called on main thread only.
         """
+        out_name = os.path.basename(out_path)
         self._progress.set(1.0)
         self._progress_label.configure(text="100% – Complete")
-        self._status.configure(text=f"✔ Decrypted → {os.path.basename(out_path)}", fg=C["success"])
+        self._status.configure(text=f"✔ Decrypted → {out_name}", fg=C["success"])
         self._byte_stream.print("\n  ✔ DECRYPTION COMPLETE", tag="success")
 
         if was_otd:
@@ -452,7 +590,7 @@ class DecryptPanel(tk.Frame):
             if self._del_after_var.get():
                 try:
                     secure_delete(out_path)
-                    self.app.history.add("SECURE_DELETE", os.path.basename(out_path),
+                    self.app.history.add("SECURE_DELETE", out_name,
                                          status="Success", user=self.app.session.username or "")
                     self._byte_stream.print("  🗑️ Plaintext securely deleted.", tag="orange")
                 except Exception as e:
@@ -460,10 +598,10 @@ class DecryptPanel(tk.Frame):
 
     def _otd_reencrypt(self, plain_path: str):
         """Re-encrypt after OTD view, then secure-delete the plaintext."""
+        self._dirty = True
         try:
             # Use a generic password for the re-encrypt (locks it back)
-            import secrets as _s
-            tmp_pwd = _s.token_hex(16)
+            tmp_pwd = secrets.token_hex(16)
             ok, _, _ = encrypt_file(plain_path, tmp_pwd, one_time_decrypt=True)
             if ok:
                 secure_delete(plain_path)
@@ -487,7 +625,12 @@ class DecryptPanel(tk.Frame):
         """Reset visualization - safe to call from main thread"""
         self._byte_stream.clear()
         self._progress.set(0.0)
+        self._last_frac = 0.0
         self._progress_label.configure(text="")
+        self._anim_state.clear()
+        if self._anim_job is not None:
+            self.after_cancel(self._anim_job)
+            self._anim_job = None
         for i in range(4):
             circle, lbl, sub, colour = self._stage_labels[i]
             circle.configure(fg=C["text_dim"])
@@ -507,29 +650,45 @@ class DecryptPanel(tk.Frame):
         circle.configure(fg=colour)
         lbl.configure(fg=colour)
         sub.configure(fg=colour)
-        _, bar_fill = self._stage_bars[idx]
 
         # Animate progress bar
-        def _fill(pct=0):
-            if pct <= 100:
-                bar_fill.configure(width=int(120 * pct / 100))
-                self.after(25, lambda: _fill(pct + 12))
-        _fill()
+        self._anim_state[idx] = 0
+        self._ensure_anim_running()
 
         # Print stage info
         tags  = ["violet", "cyan", "green", "orange"]
         names = ["▶ KEY DERIVATION", "▶ HEADER PARSE", "▶ DECRYPTION", "▶ OUTPUT"]
         self._print_bytes(names[idx], msg, tags[idx])
 
+    def _ensure_anim_running(self):
+        if self._anim_job is None:
+            self._tick_anim()
+
+    def _tick_anim(self):
+        """Advance every filling stage bar by one step from a single timer."""
+        widths = self._FILL_WIDTHS
+        for idx, step in list(self._anim_state.items()):
+            self._stage_bars[idx][1].configure(width=widths[step])
+            if step + 1 < len(widths):
+                self._anim_state[idx] = step + 1
+            else:
+                del self._anim_state[idx]
+        self._anim_job = self.after(self._FILL_TICK_MS, self._tick_anim) if self._anim_state else None
+
     def _print_bytes(self, stage_name, msg, tag):
         """Print stage information - safe to call from main thread"""
-        self._byte_stream.print(f"\n  {stage_name}", tag=tag)
-        self._byte_stream.print(f"  {msg}", tag="dim")
-        for _ in range(2):
-            line = "  " + " ".join(f"{random.randint(0,255):02x}" for _ in range(24))
-            self._byte_stream.print(line, tag=tag)
+        self._byte_stream.print_lines(
+            (f"\n  {stage_name}", tag),
+            (f"  {msg}", "dim"),
+            (next(_HEX_LINES), tag),
+            (next(_HEX_LINES), tag),
+        )
 
     def _update_progress(self, frac):
         """Update progress bar - safe to call from main thread"""
+        self._dirty = True
+        if abs(frac - self._last_frac) < 0.005:
+            return  # Sub-pixel change – not worth a repaint
+        self._last_frac = frac
         self._progress.set(frac)
         self._progress_label.configure(text=f"{int(frac*100)}%")
\ No newline at end of file
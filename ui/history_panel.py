@@ -11,6 +11,7 @@ HISTORY tab – tamper-resistant encryption log viewer.
 
 import tkinter as tk
 from core.config import C
+from core.history import display_time
 from ui.widgets  import CardFrame, NeonButton
 
 
@@ -142,7 +143,7 @@ class HistoryPanel(tk.Frame):
             fname   = entry.get("filename",     "?")
             status  = entry.get("status",       "?")
             user    = entry.get("user",         "")
-            ts      = entry.get("display_time", "?")
+            ts      = display_time(entry)
             a_colour = action_colours.get(action, C["text_mid"])
             s_colour = C["success"] if status == "Success" else C["danger"]
 
@@ -187,7 +187,7 @@ class SettingsPanel(tk.Frame):
         self._about_text.print("    • AES-256-CBC encryption", tag="dim")
         self._about_text.print("    • Scrypt key derivation (n=2¹⁵)", tag="dim")
         self._about_text.print("    • 7-pass secure file deletion", tag="dim")
-        self._about_text.print("    • HMAC-chained history log", tag="dim")
+        self._about_text.print("    • Hash-chained history log (keyed BLAKE2b)", tag="dim")
         self._about_text.print("    • One-Time Decrypt mode", tag="dim")
         self._about_text.print("    • Steganographic metadata", tag="dim")
         self._about_text.print("    • Panic Lock + auto-lock", tag="dim")
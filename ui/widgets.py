@@ -231,6 +231,7 @@ class TerminalText(tk.Frame):
 
     METHODS:
         .print(text, tag=None)              – append a line
+        .print_lines(*(text, tag))          – append several lines at once
         .clear()                            – empty the terminal
         .animate_print(text, delay_ms=18)   – character-by-character typing
     """
@@ -287,6 +288,16 @@ class TerminalText(tk.Frame):
         self.text.see("end")
         self.text.configure(state="disabled")
 
+    def print_lines(self, *lines: tuple[str, str]):
+        """Print several (line, tag) pairs with a single insert + scroll."""
+        args = []
+        for line, tag in lines:
+            args += (line + "\n", tag)
+        self.text.configure(state="normal")
+        self.text.insert("end", *args)
+        self.text.see("end")
+        self.text.configure(state="disabled")
+
     def clear(self):
         """Clear all terminal text."""
         self.text.configure(state="normal")